@@ -0,0 +1,42 @@
+"""store refresh token hashes as raw bytea digests
+
+Revision ID: a9d4b7e2c5f8
+Revises: f1c8d3a6b9e4
+Create Date: 2026-10-16 13:20:44.871530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4b7e2c5f8'
+down_revision: Union[str, None] = 'f1c8d3a6b9e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows hold hex SHA-256 digests; decode them in place. The unique
+    # constraint and the partial covering index are rebuilt on the new type.
+    op.alter_column(
+        'refresh_tokens',
+        'token_hash',
+        existing_type=sa.String(length=255),
+        type_=sa.LargeBinary(),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'refresh_tokens',
+        'token_hash',
+        existing_type=sa.LargeBinary(),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
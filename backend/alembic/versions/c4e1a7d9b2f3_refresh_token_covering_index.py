@@ -0,0 +1,35 @@
+"""replace refresh token hash index with partial covering index
+
+Revision ID: c4e1a7d9b2f3
+Revises: 5b8a2405ee9b
+Create Date: 2026-10-16 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1a7d9b2f3'
+down_revision: Union[str, None] = '5b8a2405ee9b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_refresh_tokens_token_hash', table_name='refresh_tokens')
+    op.create_index(
+        'idx_refresh_tokens_hash_covering',
+        'refresh_tokens',
+        ['token_hash'],
+        unique=False,
+        postgresql_include=['revoked', 'expires_at', 'user_id'],
+        postgresql_where=sa.text('revoked = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_refresh_tokens_hash_covering', table_name='refresh_tokens')
+    op.create_index('idx_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], unique=False)
@@ -0,0 +1,32 @@
+"""add partial index on active refresh tokens per user
+
+Revision ID: d7a2e5c8f4b1
+Revises: c4e1a7d9b2f3
+Create Date: 2026-10-16 11:03:47.218905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2e5c8f4b1'
+down_revision: Union[str, None] = 'c4e1a7d9b2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_refresh_tokens_active_user',
+        'refresh_tokens',
+        ['user_id', 'expires_at'],
+        unique=False,
+        postgresql_where=sa.text('revoked = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_refresh_tokens_active_user', table_name='refresh_tokens')
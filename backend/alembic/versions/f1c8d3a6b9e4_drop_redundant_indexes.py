@@ -0,0 +1,39 @@
+"""drop indexes duplicated by unique constraints or ix_ indexes
+
+Revision ID: f1c8d3a6b9e4
+Revises: e3b9c6f1a8d2
+Create Date: 2026-10-16 12:05:52.140377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c8d3a6b9e4'
+down_revision: Union[str, None] = 'e3b9c6f1a8d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns) — each duplicates an index that stays in place.
+REDUNDANT_INDEXES = (
+    ('idx_users_email', 'users', ['email']),
+    ('idx_users_google_id', 'users', ['google_id']),
+    ('idx_refresh_tokens_user_id', 'refresh_tokens', ['user_id']),
+    ('idx_user_preferences_user_id', 'user_preferences', ['user_id']),
+    ('idx_trips_user_id', 'trips', ['user_id']),
+    ('idx_trip_versions_trip_id', 'trip_versions', ['trip_id']),
+    ('idx_trip_versions_phase', 'trip_versions', ['phase']),
+    ('idx_trip_messages_trip_id', 'trip_messages', ['trip_id']),
+)
+
+
+def upgrade() -> None:
+    for name, table, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in REDUNDANT_INDEXES:
+        op.create_index(name, table, columns, unique=False)
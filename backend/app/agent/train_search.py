@@ -5,7 +5,7 @@ import re
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from statistics import median
-from typing import Optional
+from typing import NamedTuple, Optional
 from urllib.parse import urlparse
 
 from ddgs import DDGS
@@ -33,8 +33,24 @@ _TRUSTED_TRAIN_DOMAINS = {
     "redbus.in",
     "railmitra.com",
 }
+_TRUSTED_TRAIN_SUFFIXES = tuple(f".{domain}" for domain in _TRUSTED_TRAIN_DOMAINS)
 
-# Common Indian city/station mappings for validation
+
+class _TrainCandidate(NamedTuple):
+    """Compact record for a single train fare search result."""
+
+    title: str
+    body: str
+    url: str
+    domain: str
+    trusted: bool
+    prices: list[float]
+
+
+_INDIA_INDICATORS = ("india", "bharat", "hindustan")
+
+# Common Indian city/station mappings for validation (kept lower-case so
+# membership checks only need to casefold the location being tested).
 INDIAN_CITIES = {
     "delhi",
     "mumbai",
@@ -168,12 +184,8 @@ def _extract_domain(url: str) -> str:
     return urlparse(url).netloc.replace("www.", "").lower()
 
 
-def _is_trusted_train_source(url: str) -> bool:
-    domain = _extract_domain(url)
-    return any(
-        domain == trusted_domain or domain.endswith(f".{trusted_domain}")
-        for trusted_domain in _TRUSTED_TRAIN_DOMAINS
-    )
+def _is_trusted_train_domain(domain: str) -> bool:
+    return domain in _TRUSTED_TRAIN_DOMAINS or domain.endswith(_TRUSTED_TRAIN_SUFFIXES)
 
 
 def _sanitize_snippet(text: str) -> str:
@@ -187,14 +199,14 @@ def _is_indian_city(location: str) -> bool:
     if not location:
         return False
 
-    location_lower = location.lower()
+    location_folded = location.casefold()
 
     for city in INDIAN_CITIES:
-        if city in location_lower:
+        if city in location_folded:
             return True
 
-    for indicator in ("india", "bharat", "hindustan"):
-        if indicator in location_lower:
+    for indicator in _INDIA_INDICATORS:
+        if indicator in location_folded:
             return True
 
     return False
@@ -312,36 +324,36 @@ def search_train_costs(
             result["summary"] = f"No train data found for {origin} -> {destination}"
             return result
 
-        candidates: list[dict] = []
+        candidates: list[_TrainCandidate] = []
+        trusted_candidates: list[_TrainCandidate] = []
+        all_prices: list[float] = []
+        trusted_prices: list[float] = []
+        sanitize = _sanitize_snippet
         for raw in results:
-            title = (raw.get("title") or "").strip()
-            body = (raw.get("body") or "").strip()
-            href = (raw.get("href") or "").strip()
+            get = raw.get
+            title = (get("title") or "").strip()
+            body = (get("body") or "").strip()
+            href = (get("href") or "").strip()
             domain = _extract_domain(href)
-            combined_text = " ".join(part for part in (title, body) if part)
-            candidates.append(
-                {
-                    "title": _sanitize_snippet(title),
-                    "body": _sanitize_snippet(body),
-                    "url": href,
-                    "domain": domain,
-                    "trusted": _is_trusted_train_source(href),
-                    "prices": _extract_rupee_prices(combined_text),
-                }
+            combined_text = f"{title} {body}" if title and body else title or body
+            candidate = _TrainCandidate(
+                title=sanitize(title),
+                body=sanitize(body),
+                url=href,
+                domain=domain,
+                trusted=_is_trusted_train_domain(domain),
+                prices=_extract_rupee_prices(combined_text),
             )
+            candidates.append(candidate)
+            all_prices.extend(candidate.prices)
+            if candidate.trusted:
+                trusted_candidates.append(candidate)
+                trusted_prices.extend(candidate.prices)
 
-        trusted_candidates = [
-            candidate for candidate in candidates if candidate["trusted"]
-        ]
         selected_candidates = trusted_candidates or candidates
         result["trusted_sources"] = len(trusted_candidates)
-
-        costs_found: list[float] = []
-        for candidate in selected_candidates:
-            costs_found.extend(candidate["prices"])
-        if not costs_found:
-            for candidate in candidates:
-                costs_found.extend(candidate["prices"])
+        # Prefer fares from trusted sources, falling back to every result.
+        costs_found = trusted_prices or all_prices
 
         estimated_cost = None
         if costs_found:
@@ -351,14 +363,15 @@ def search_train_costs(
         within_budget = _is_within_budget(estimated_cost, budget)
         result["within_budget"] = within_budget
 
-        snippets: list[str] = []
+        parts: list[str] = [
+            f"Train Cost Estimates ({origin} -> {destination} - Indian Railways):\n"
+        ]
+        header_len = len(parts)
         for candidate in selected_candidates[:4]:
-            source = candidate["domain"] or "search result"
-            snippet = candidate["body"] or candidate["title"]
+            snippet = candidate.body or candidate.title
             if not snippet:
                 continue
-            snippet = snippet[:220].rstrip()
-            fares = candidate["prices"]
+            fares = candidate.prices
             fare_hint = ""
             if fares:
                 low = min(fares)
@@ -368,31 +381,35 @@ def search_train_costs(
                     if low == high
                     else f" (observed fares: ₹{low:.0f}-₹{high:.0f})"
                 )
-            url_hint = f" ({candidate['url']})" if candidate["url"] else ""
-            snippets.append(f"- {source}: {snippet}{fare_hint}{url_hint}")
+            parts += (
+                "- ",
+                candidate.domain or "search result",
+                ": ",
+                snippet[:220].rstrip(),
+                fare_hint,
+                f" ({candidate.url})" if candidate.url else "",
+                "\n",
+            )
+        if len(parts) == header_len:
+            parts.append("No reliable fare snippets found.\n")
 
         trust_note = (
             "Trusted railway sources found."
             if trusted_candidates
             else "Limited trusted railway sources; verify options on IRCTC before booking."
         )
-        budget_note = ""
+        parts += (
+            "\n",
+            trust_note,
+            "\nUse these as fare benchmarks; do not assume a specific train number "
+            "unless verified on official sources.",
+        )
         if estimated_cost and not within_budget:
-            budget_note = (
+            parts.append(
                 f"\n\nBudget Alert: Estimated train fare around ₹{estimated_cost:.0f} "
                 "may exceed 40% of your stated budget."
             )
-
-        snippet_block = (
-            "\n".join(snippets) if snippets else "No reliable fare snippets found."
-        )
-        result["summary"] = (
-            f"Train Cost Estimates ({origin} -> {destination} - Indian Railways):\n"
-            f"{snippet_block}\n\n{trust_note}"
-            "\nUse these as fare benchmarks; do not assume a specific train number "
-            "unless verified on official sources."
-            f"{budget_note}"
-        )
+        result["summary"] = "".join(parts)
 
         msg = (
             f"[TRAIN SEARCH] Found {len(results)} results, "
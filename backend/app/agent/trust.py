@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import re
-from urllib.parse import quote_plus, urlparse
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import quote_plus
 
 from app.agent.models import (
     ConfidenceBreakdown,
@@ -12,7 +14,9 @@ from app.agent.models import (
     TravelPlan,
 )
 
-_URL_PATTERN = re.compile(r"https?://[^\s\])\"'>,;]+")
+# The final character class excludes "." so trailing sentence punctuation is
+# never captured and matches need no post-processing.
+_URL_PATTERN = re.compile(r"https?://[^\s\])\"'>,;]*[^\s\])\"'>,;.]")
 _BAD_URL_TOKENS = (
     "example.com",
     "localhost",
@@ -25,11 +29,35 @@ _BAD_URL_TOKENS = (
     "notfound",
     "n/a",
 )
+_SCHEME_HOST_PATTERN = re.compile(r"(https?)://([^/?#]*)", re.IGNORECASE)
+_BAD_URL_PATTERN = re.compile(
+    "|".join(re.escape(token) for token in _BAD_URL_TOKENS), re.IGNORECASE
+)
+# Each branch is a lookahead over the whole domain, so the alternation order
+# keeps the original category priority (lodging > flight > advisory > weather)
+# while the classification still happens in a single match call.
+_SOURCE_TYPE_PATTERN = re.compile(
+    r"""
+    (?=.*(?:booking|agoda|airbnb|expedia|hotel))(?P<lodging>)
+    |(?=.*(?:skyscanner|kayak|flight|airline))(?P<flight>)
+    |(?=.*(?:gov|travel\.state|cdc|who\.int))(?P<advisory>)
+    |(?=.*(?:weather|met|accuweather))(?P<weather>)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
 _TRAIN_NUMBER_PATTERN = re.compile(r"\b\d{5}\b")
+_ASCII_DIGITS = frozenset("0123456789")
+_PRICE_WHOLE_CHARS = _ASCII_DIGITS | {","}
+_MAX_TRAIN_OPTIONS = 4
+# Constant search-query suffixes, URL-encoded once at import time.
+_FLIGHT_QUERY_SUFFIX = quote_plus("flight booking")
+_STAY_QUERY_SUFFIX = quote_plus("hotel booking")
+_TRAIN_QUERY_SUFFIX = quote_plus("IRCTC train booking")
 _MULTISPACE_PATTERN = re.compile(r"\s+")
 _PRICE_DIGIT_PATTERN = re.compile(r"^\d[\d,]*(?:\.\d+)?$")
 
 
+@lru_cache(maxsize=1024)
 def _clean_fragment(value: str | None) -> str:
     if not value:
         return ""
@@ -37,73 +65,76 @@ def _clean_fragment(value: str | None) -> str:
 
 
 def _infer_source_type(domain: str) -> str:
-    lowered = domain.lower()
-    if any(k in lowered for k in ("booking", "agoda", "airbnb", "expedia", "hotel")):
-        return "lodging"
-    if any(k in lowered for k in ("skyscanner", "kayak", "flight", "airline")):
-        return "flight"
-    if any(k in lowered for k in ("gov", "travel.state", "cdc", "who.int")):
-        return "advisory"
-    if any(k in lowered for k in ("weather", "met", "accuweather")):
-        return "weather"
-    return "general"
+    match = _SOURCE_TYPE_PATTERN.match(domain)
+    return match.lastgroup if match else "general"
+
+
+def _split_scheme_host(url: str) -> tuple[str | None, str | None]:
+    """Return ``(scheme, netloc)`` for an http(s) URL, else ``(None, None)``."""
+    match = _SCHEME_HOST_PATTERN.match(url)
+    if not match:
+        return None, None
+    return match.group(1), match.group(2)
 
 
 def _is_http_url(url: str) -> bool:
-    if not url:
+    if not url or _BAD_URL_PATTERN.search(url):
         return False
-    lowered = url.lower()
-    if any(token in lowered for token in _BAD_URL_TOKENS):
-        return False
-    parsed = urlparse(url)
-    return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
+    _, host = _split_scheme_host(url)
+    return bool(host)
+
+
+def _encode_search_query(parts: tuple[str, ...], encoded_suffix: str) -> str:
+    """Quote the non-empty ``parts`` and append an already-quoted suffix."""
+    prefix = " ".join(filter(None, parts))
+    if not prefix:
+        return encoded_suffix
+    return f"{quote_plus(prefix)}+{encoded_suffix}"
 
 
+@lru_cache(maxsize=512)
 def _flight_search_deeplink(route: str, airline: str | None = None) -> str:
-    query = " ".join(
-        part
-        for part in [_clean_fragment(route), _clean_fragment(airline), "flight booking"]
-        if part
+    query = _encode_search_query(
+        (_clean_fragment(route), _clean_fragment(airline)),
+        _FLIGHT_QUERY_SUFFIX,
     )
-    return f"https://www.google.com/travel/flights?q={quote_plus(query)}"
+    return f"https://www.google.com/travel/flights?q={query}"
 
 
+@lru_cache(maxsize=512)
 def _stay_search_deeplink(
     name: str,
     location: str | None = None,
     destination: str | None = None,
 ) -> str:
-    query = " ".join(
-        part
-        for part in [
+    query = _encode_search_query(
+        (
             _clean_fragment(name),
             _clean_fragment(location),
             _clean_fragment(destination),
-            "hotel booking",
-        ]
-        if part
+        ),
+        _STAY_QUERY_SUFFIX,
     )
-    return f"https://www.booking.com/searchresults.html?ss={quote_plus(query)}"
+    return f"https://www.booking.com/searchresults.html?ss={query}"
 
 
+@lru_cache(maxsize=512)
 def _train_search_deeplink(
     route: str,
     train_name: str | None = None,
     origin: str | None = None,
     destination: str | None = None,
 ) -> str:
-    query = " ".join(
-        part
-        for part in [
+    query = _encode_search_query(
+        (
             _clean_fragment(origin),
             _clean_fragment(destination),
             _clean_fragment(route),
             _clean_fragment(train_name),
-            "IRCTC train booking",
-        ]
-        if part
+        ),
+        _TRAIN_QUERY_SUFFIX,
     )
-    return f"https://www.google.com/search?q={quote_plus(query)}"
+    return f"https://www.google.com/search?q={query}"
 
 
 def _normalize_train_name(train_name: str | None) -> str | None:
@@ -112,43 +143,68 @@ def _normalize_train_name(train_name: str | None) -> str | None:
     if not cleaned:
         return None
 
-    cleaned = _TRAIN_NUMBER_PATTERN.sub("", cleaned)
-    cleaned = _clean_fragment(cleaned.strip("-:|"))
-    if not cleaned:
-        return None
+    stripped = cleaned
+    # Most names carry no number; skip the regex unless a digit could match.
+    if not (stripped.isascii() and _ASCII_DIGITS.isdisjoint(stripped)):
+        stripped = _TRAIN_NUMBER_PATTERN.sub("", stripped)
+    stripped = stripped.strip("-:|")
+    # ``cleaned`` is already whitespace-normalized, so only re-clean on change.
+    if stripped != cleaned:
+        cleaned = _clean_fragment(stripped)
+        if not cleaned:
+            return None
 
     tokens = cleaned.split()
     if not tokens:
         return None
-    code_like_tokens = sum(1 for token in tokens if token.isupper() or len(token) <= 3)
-    if len(tokens) >= 3 and (code_like_tokens / len(tokens)) >= 0.8:
-        return None
+    # Names of one or two tokens are always kept, so only score longer ones.
+    if len(tokens) >= 3:
+        code_like_tokens = sum(
+            1 for token in tokens if len(token) <= 3 or token.isupper()
+        )
+        if code_like_tokens / len(tokens) >= 0.8:
+            return None
     return cleaned
 
 
 def _normalize_train_route(
     route: str | None,
-    default_origin: str | None,
-    default_destination: str | None,
+    default_route: str | None,
+    origin_key: str,
+    destination_key: str,
 ) -> str:
+    """Fall back to ``default_route`` unless ``route`` names both endpoints.
+
+    ``origin_key``/``destination_key`` are the lower-cased default endpoints,
+    computed once per plan by the caller.
+    """
     cleaned = _clean_fragment(route)
-    if not cleaned and default_origin and default_destination:
-        return f"{default_origin} to {default_destination}"
-    if (
-        default_origin
-        and default_destination
-        and (
-            default_origin.lower() not in cleaned.lower()
-            or default_destination.lower() not in cleaned.lower()
-        )
-    ):
-        return f"{default_origin} to {default_destination}"
+    if default_route is None:
+        return cleaned
+    if not cleaned:
+        return default_route
+    lowered = cleaned.lower()
+    if origin_key not in lowered or destination_key not in lowered:
+        return default_route
     return cleaned
 
 
+def _is_bare_amount(text: str) -> bool:
+    """Return True for plain amounts such as ``1500``, ``1,500`` or ``1500.50``."""
+    if not text.isascii():
+        # ``\d`` also accepts non-ASCII digits; defer to the regex for those.
+        return bool(_PRICE_DIGIT_PATTERN.fullmatch(text))
+    whole, dot, fraction = text.partition(".")
+    if not whole or whole[0] not in _ASCII_DIGITS:
+        return False
+    if not _PRICE_WHOLE_CHARS.issuperset(whole):
+        return False
+    return not dot or (bool(fraction) and _ASCII_DIGITS.issuperset(fraction))
+
+
 def _normalize_price_text(price: str) -> str:
     cleaned = _clean_fragment(price)
-    if _PRICE_DIGIT_PATTERN.fullmatch(cleaned):
+    if _is_bare_amount(cleaned):
         return f"₹{cleaned}"
     return cleaned
 
@@ -159,10 +215,13 @@ def _normalize_booking_links(
     default_destination: str | None = None,
 ) -> None:
     """Force robust booking deeplinks so users avoid stale 404 pages."""
+    if not (plan.flights or plan.lodgings or plan.trains):
+        return
+
     for flight in plan.flights:
         deeplink = _flight_search_deeplink(flight.route, flight.airline)
         original = (flight.booking_url or "").strip()
-        if _is_http_url(original) and original != deeplink:
+        if original != deeplink and _is_http_url(original):
             if not flight.notes:
                 flight.notes = f"Original link provided: {original}"
         flight.booking_url = deeplink
@@ -174,18 +233,32 @@ def _normalize_booking_links(
             default_destination,
         )
         original = (stay.booking_url or "").strip()
-        if _is_http_url(original) and original != deeplink:
+        if original != deeplink and _is_http_url(original):
             if not stay.notes:
                 stay.notes = f"Original link provided: {original}"
         stay.booking_url = deeplink
 
+    if not plan.trains:
+        return
+
+    default_route = None
+    origin_key = destination_key = ""
+    if default_origin and default_destination:
+        default_route = f"{default_origin} to {default_destination}"
+        origin_key = default_origin.lower()
+        destination_key = default_destination.lower()
+
     seen_train_keys: set[tuple[str, str, str]] = set()
     normalized_trains = []
     for train in plan.trains:
+        if len(normalized_trains) >= _MAX_TRAIN_OPTIONS:
+            # Trains past the cap are dropped, so skip normalizing them.
+            break
         train.route = _normalize_train_route(
             train.route,
-            default_origin=default_origin,
-            default_destination=default_destination,
+            default_route=default_route,
+            origin_key=origin_key,
+            destination_key=destination_key,
         )
         train.train_name = _normalize_train_name(train.train_name)
         train.price = _normalize_price_text(train.price)
@@ -196,7 +269,7 @@ def _normalize_booking_links(
             destination=default_destination,
         )
         original = _clean_fragment(train.booking_url)
-        if _is_http_url(original) and original != deeplink:
+        if original != deeplink and _is_http_url(original):
             if not train.notes:
                 train.notes = f"Original link provided: {original}"
         train.booking_url = deeplink
@@ -210,7 +283,7 @@ def _normalize_booking_links(
             seen_train_keys.add(train_key)
             normalized_trains.append(train)
 
-    plan.trains = normalized_trains[:4]
+    plan.trains = normalized_trains
 
 
 def extract_sources(
@@ -220,28 +293,29 @@ def extract_sources(
     seen: set[str] = set()
     sources: list[SourceAttribution] = []
 
-    # Prefer the most recent research context.
-    for block in reversed(search_results[-10:]):
-        for raw_url in _URL_PATTERN.findall(block):
-            normalized = raw_url.rstrip(".,)")
-            if normalized in seen:
-                continue
-            parsed = urlparse(normalized)
-            if not parsed.netloc:
-                continue
-
-            domain = parsed.netloc.replace("www.", "")
-            sources.append(
-                SourceAttribution(
-                    url=normalized,
-                    domain=domain,
-                    source_type=_infer_source_type(domain),
-                )
+    # Prefer the most recent research context. URLs never contain whitespace,
+    # so the newline-joined blocks can be scanned in a single pass.
+    research = "\n".join(reversed(search_results[-10:]))
+    for match in _URL_PATTERN.finditer(research):
+        normalized = match.group()
+        if normalized in seen:
+            continue
+        _, host = _split_scheme_host(normalized)
+        if not host or _BAD_URL_PATTERN.search(normalized):
+            continue
+
+        domain = host.replace("www.", "")
+        sources.append(
+            SourceAttribution(
+                url=normalized,
+                domain=domain,
+                source_type=_infer_source_type(domain),
             )
-            seen.add(normalized)
+        )
+        seen.add(normalized)
 
-            if len(sources) >= limit:
-                return sources
+        if len(sources) >= limit:
+            break
     return sources
 
 
@@ -251,38 +325,82 @@ def _score_source_coverage(source_count: int) -> int:
     return min(100, 30 + source_count * 12)
 
 
-def _score_cost_completeness(plan: TravelPlan) -> int:
-    total_activities = sum(len(day.activities) for day in plan.days)
-    activities_with_cost = sum(
-        1 for day in plan.days for activity in day.activities if activity.cost_estimate
+@dataclass(slots=True)
+class _PlanStats:
+    """Per-plan counts that drive the cost/specificity sub-scores."""
+
+    day_count: int
+    total_activities: int
+    activities_with_cost: int
+    days_with_totals: int
+    days_with_travel: int
+    days_with_stay: int
+    days_with_notes_or_tips: int
+    has_budget: bool
+    has_bookings: bool
+
+
+def _summarize_plan(plan: TravelPlan) -> _PlanStats:
+    """Collect every scoring count in a single pass over ``plan.days``."""
+    total_activities = 0
+    activities_with_cost = 0
+    days_with_totals = 0
+    days_with_travel = 0
+    days_with_stay = 0
+    days_with_notes_or_tips = 0
+
+    for day in plan.days:
+        activities = day.activities
+        total_activities += len(activities)
+        for activity in activities:
+            if activity.cost_estimate:
+                activities_with_cost += 1
+        if day.day_total:
+            days_with_totals += 1
+        if day.travel_time or day.travel_cost:
+            days_with_travel += 1
+        if day.accommodation:
+            days_with_stay += 1
+        if day.notes or day.tips:
+            days_with_notes_or_tips += 1
+
+    return _PlanStats(
+        day_count=len(plan.days),
+        total_activities=total_activities,
+        activities_with_cost=activities_with_cost,
+        days_with_totals=days_with_totals,
+        days_with_travel=days_with_travel,
+        days_with_stay=days_with_stay,
+        days_with_notes_or_tips=days_with_notes_or_tips,
+        has_budget=bool(plan.budget_breakdown),
+        has_bookings=bool(plan.flights or plan.lodgings),
     )
 
+
+def _score_cost_completeness(stats: _PlanStats) -> int:
     activity_score = 40
-    if total_activities > 0:
-        activity_score = int((activities_with_cost / total_activities) * 100)
+    if stats.total_activities > 0:
+        activity_score = int(
+            (stats.activities_with_cost / stats.total_activities) * 100
+        )
 
-    days_with_totals = sum(1 for day in plan.days if day.day_total)
     day_total_score = (
-        int((days_with_totals / len(plan.days)) * 100) if plan.days else 40
+        int((stats.days_with_totals / stats.day_count) * 100) if stats.day_count else 40
     )
-    budget_score = 100 if plan.budget_breakdown else 50
+    budget_score = 100 if stats.has_budget else 50
 
     combined = int(activity_score * 0.55 + day_total_score * 0.25 + budget_score * 0.20)
     return max(0, min(100, combined))
 
 
-def _score_itinerary_specificity(plan: TravelPlan) -> int:
-    if not plan.days:
+def _score_itinerary_specificity(stats: _PlanStats) -> int:
+    if not stats.day_count:
         return 30
 
-    with_travel = sum(1 for day in plan.days if day.travel_time or day.travel_cost)
-    with_stay = sum(1 for day in plan.days if day.accommodation)
-    with_notes_or_tips = sum(1 for day in plan.days if day.notes or day.tips)
-
-    travel_score = int((with_travel / len(plan.days)) * 100)
-    stay_score = int((with_stay / len(plan.days)) * 100)
-    tips_score = int((with_notes_or_tips / len(plan.days)) * 100)
-    booking_score = 100 if (plan.flights or plan.lodgings) else 40
+    travel_score = int((stats.days_with_travel / stats.day_count) * 100)
+    stay_score = int((stats.days_with_stay / stats.day_count) * 100)
+    tips_score = int((stats.days_with_notes_or_tips / stats.day_count) * 100)
+    booking_score = 100 if stats.has_bookings else 40
 
     combined = int(
         travel_score * 0.30
@@ -295,9 +413,10 @@ def _score_itinerary_specificity(plan: TravelPlan) -> int:
 
 def build_plan_confidence(plan: TravelPlan, source_count: int) -> PlanConfidence:
     """Generate an interpretable confidence score for a plan."""
+    stats = _summarize_plan(plan)
     source_coverage = _score_source_coverage(source_count)
-    cost_completeness = _score_cost_completeness(plan)
-    itinerary_specificity = _score_itinerary_specificity(plan)
+    cost_completeness = _score_cost_completeness(stats)
+    itinerary_specificity = _score_itinerary_specificity(stats)
 
     score = int(
         source_coverage * 0.35 + cost_completeness * 0.40 + itinerary_specificity * 0.25
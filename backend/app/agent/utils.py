@@ -5,6 +5,20 @@ from typing import Optional
 
 from app.agent.models import ConversationState
 
+# Currency keywords (matched against upper-cased text) in priority order: the
+# first currency with any keyword present wins.
+_CURRENCY_KEYWORDS: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("INR", "₹", "LAKH", "RUPEE", "RS"), "INR"),
+    (("USD", "$", "DOLLAR"), "USD"),
+    (("EUR", "€", "EURO"), "EUR"),
+    (("JPY", "¥", "YEN"), "JPY"),
+    (("GBP", "£", "POUND"), "GBP"),
+    (("THB", "BAHT"), "THB"),
+    (("AUD", "A$"), "AUD"),
+    (("CAD", "C$"), "CAD"),
+    (("SGD", "S$"), "SGD"),
+)
+
 
 def get_current_date_context() -> str:
     """Get current date context for prompts.
@@ -29,32 +43,21 @@ def detect_budget_currency(state: ConversationState, current_input: Optional[str
     # Check current input first as it's the most recent preference
     search_targets = []
     if current_input:
-        search_targets.append(current_input.upper())
+        search_targets.append(current_input)
     
     if state.constraints and state.constraints.budget:
-        search_targets.append(state.constraints.budget.upper())
+        search_targets.append(state.constraints.budget)
     
     # If no budget info at all, check full conversation history for currency symbols
     if not search_targets:
         for msg in reversed(state.messages):
             if msg.role == "user":
-                search_targets.append(msg.content.upper())
-
-    currency_map = {
-        ("INR", "₹", "LAKH", "RUPEE", "RS"): "INR",
-        ("USD", "$", "DOLLAR"): "USD",
-        ("EUR", "€", "EURO"): "EUR",
-        ("JPY", "¥", "YEN"): "JPY",
-        ("GBP", "£", "POUND"): "GBP",
-        ("THB", "BAHT"): "THB",
-        ("AUD", "A$"): "AUD",
-        ("CAD", "C$"): "CAD",
-        ("SGD", "S$"): "SGD",
-    }
-    
+                search_targets.append(msg.content)
+
     for target in search_targets:
-        for keywords, code in currency_map.items():
+        target = target.upper()
+        for keywords, code in _CURRENCY_KEYWORDS:
             if any(kw in target for kw in keywords):
                 return code
-                
+
     return "USD"
@@ -1,12 +1,18 @@
-from typing import Annotated, AsyncGenerator
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Annotated, Any, AsyncGenerator, TypeVar
 from uuid import UUID
-from sqlalchemy import select
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from app.db.database import AsyncSessionLocal
 from fastapi.security import OAuth2PasswordBearer
 from app.config import get_settings
 from app.db.models import User
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from app.core.security import verify_access_token
 import jwt
 
@@ -14,6 +20,60 @@ settings = get_settings()
 
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl=f"{settings.api_v1_str}/auth/login")
 
+# Clients send the same subject on every request; skip re-parsing it each time.
+# Invalid strings raise ValueError and are never cached.
+_parse_user_id = lru_cache(maxsize=1024)(UUID)
+
+# Short-lived per-process cache of authenticated users so warm clients skip the
+# users-table round-trip. Entries are (loaded_at, column values) and are dropped
+# on logout; the TTL bounds staleness for any other profile change. Plain values
+# are cached rather than the ORM instance, which stays bound to the session that
+# loaded it and is expired if that session rolls back.
+_USER_CACHE_TTL_SECONDS = 30.0
+_USER_CACHE_MAX_SIZE = 1024
+_USER_COLUMNS = tuple(attr.key for attr in sa_inspect(User).column_attrs)
+_user_cache: dict[UUID, tuple[float, dict[str, Any]]] = {}
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop a user from the authentication cache (e.g. after logout)."""
+    _user_cache.pop(user_id, None)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def json_body(model: type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """Dependency that validates the raw request body with ``model_validate_json``.
+
+    pydantic-core parses and validates the bytes in one pass, instead of
+    FastAPI decoding to a dict first and validating that. Errors are raised as
+    ``RequestValidationError`` so clients still get the usual 422 payload.
+    """
+
+    async def parse(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in exc.errors(include_url=False)
+                ]
+            ) from None
+
+    return parse
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """``openapi_extra`` documenting a body read through :func:`json_body`."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as db:
@@ -40,18 +100,32 @@ async def get_current_user(
             raise credentials_exception
             
         # Convert to UUID inside the try block to catch format errors
-        user_id = UUID(user_id_str)
+        user_id = _parse_user_id(user_id_str)
         
     except (jwt.PyJWTError, ValueError):
         # If signature is wrong, expired, malformed, or user_id is not a valid UUID
         raise credentials_exception
 
-    # Execute query
-    result = await db.execute(select(User).where(User.id == user_id))
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        loaded_at, columns = cached
+        if time.monotonic() - loaded_at < _USER_CACHE_TTL_SECONDS:
+            # Rebuild a detached copy and attach it without re-querying
+            cached_user = User(**columns)
+            make_transient_to_detached(cached_user)
+            return await db.merge(cached_user, load=False)
+        del _user_cache[user_id]
 
-    user = result.scalar_one_or_none()
+    # Primary-key lookup checks the session identity map before querying
+    user = await db.get(User, user_id)
 
     if user is None:
         raise credentials_exception
 
+    if len(_user_cache) >= _USER_CACHE_MAX_SIZE:
+        _user_cache.clear()
+    _user_cache[user_id] = (
+        time.monotonic(),
+        {key: getattr(user, key) for key in _USER_COLUMNS},
+    )
     return user
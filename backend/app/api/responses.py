@@ -0,0 +1,27 @@
+"""Response helpers shared by the API routers."""
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def model_json_response(
+    model: BaseModel, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Render an already-built response model with pydantic-core's serializer.
+
+    Services hand back validated models built from trusted data, so returning
+    a ready-made Response skips FastAPI's re-validation and encoder pass. The
+    route's ``response_model`` still documents the shape in OpenAPI.
+
+    Args:
+        model: Response model to serialize.
+        status_code: HTTP status code for the response.
+
+    Returns:
+        A JSON ``Response`` carrying the serialized model.
+    """
+    return Response(
+        model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
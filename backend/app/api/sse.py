@@ -0,0 +1,32 @@
+"""Server-sent event framing shared by the streaming trip endpoints.
+
+Event names and the blank-line terminator never change, so they are kept
+as pre-encoded bytes; only the JSON payload is produced per event.
+"""
+
+from typing import Any
+
+import orjson
+
+META_PREFIX = b"event: meta\ndata: "
+DELTA_PREFIX = b"event: delta\ndata: "
+STATUS_PREFIX = b"event: status\ndata: "
+TOKEN_PREFIX = b"event: token\ndata: "
+IMAGES_PREFIX = b"event: images\ndata: "
+PLAN_META_PREFIX = b"event: plan_meta\ndata: "
+ERROR_PREFIX = b"event: error\ndata: "
+FRAME_SUFFIX = b"\n\n"
+DONE_FRAME = b"event: done\ndata: {}\n\n"
+
+
+def sse_frame(prefix: bytes, payload: Any) -> bytes:
+    """Build one SSE frame from a pre-encoded prefix and a JSON payload.
+
+    Args:
+        prefix: One of the ``*_PREFIX`` constants (``event:`` + ``data:``).
+        payload: JSON-serializable event data.
+
+    Returns:
+        The complete frame, ready to yield from a streaming response.
+    """
+    return b"".join((prefix, orjson.dumps(payload), FRAME_SUFFIX))
@@ -1,15 +1,23 @@
 """Auth API endpoints for user registration and login."""
 
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Annotated, Optional
 from urllib.parse import urlencode
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from authlib.integrations.starlette_client import OAuthError
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import (
+    get_db,
+    get_current_user,
+    invalidate_cached_user,
+    json_body,
+    json_body_openapi,
+)
+from app.api.responses import model_json_response
 from app.config import get_settings
 from app.services.auth import (
     register_user,
@@ -23,6 +31,7 @@ from app.schemas.user import (
     UserLogin,
     TokenResponse,
     UserResponse,
+    user_to_response,
     RefreshTokenRequest,
     LogoutRequest,
 )
@@ -34,52 +43,86 @@ settings = get_settings()
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Where OAuth redirects land when the client didn't send an Origin header.
+_DEFAULT_FRONTEND_BASE = (
+    settings.allowed_origins[0] if settings.allowed_origins else settings.frontend_url
+)
+
+
+@dataclass(slots=True)
+class ClientInfo:
+    """Device and network details recorded alongside issued refresh tokens."""
+
+    device_info: Optional[str]
+    ip_address: Optional[str]
+
 
-def get_client_info(request: Request) -> tuple[Optional[str], Optional[str]]:
+def get_client_info(request: Request) -> ClientInfo:
     """Extract device info and IP address from request."""
-    device_info = request.headers.get("user-agent")
-    ip_address = request.client.host if request.client else None
-    return device_info, ip_address
+    client = request.client
+    return ClientInfo(
+        device_info=request.headers.get("user-agent"),
+        ip_address=client.host if client else None,
+    )
 
 
-@router.post("/register", response_model=TokenResponse)
+@router.post(
+    "/register",
+    response_model=TokenResponse,
+    openapi_extra=json_body_openapi(UserCreate),
+)
 async def register_new_user(
-    user_in: UserCreate,
+    user_in: Annotated[UserCreate, Depends(json_body(UserCreate))],
     request: Request,
     db: AsyncSession = Depends(get_db),
-) -> TokenResponse:
+) -> Response:
     """Register a new user."""
-    device_info, ip_address = get_client_info(request)
-    return await register_user(db, user_in, device_info, ip_address)
+    client = get_client_info(request)
+    result = await register_user(db, user_in, client.device_info, client.ip_address)
+    return model_json_response(result)
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    openapi_extra=json_body_openapi(UserLogin),
+)
 async def login_user(
-    user_in: UserLogin,
+    user_in: Annotated[UserLogin, Depends(json_body(UserLogin))],
     request: Request,
     db: AsyncSession = Depends(get_db),
-) -> TokenResponse:
+) -> Response:
     """Authenticate user and return access token."""
-    device_info, ip_address = get_client_info(request)
-    return await authenticate_user(db, user_in, device_info, ip_address)
+    client = get_client_info(request)
+    result = await authenticate_user(
+        db, user_in, client.device_info, client.ip_address
+    )
+    return model_json_response(result)
 
 
-@router.post("/refresh", response_model=TokenResponse)
+@router.post(
+    "/refresh",
+    response_model=TokenResponse,
+    openapi_extra=json_body_openapi(RefreshTokenRequest),
+)
 async def refresh_token(
-    refresh_data: RefreshTokenRequest,
+    refresh_data: Annotated[
+        RefreshTokenRequest, Depends(json_body(RefreshTokenRequest))
+    ],
     request: Request,
     db: AsyncSession = Depends(get_db),
-) -> TokenResponse:
+) -> Response:
     """Refresh access token using a valid refresh token."""
-    device_info, ip_address = get_client_info(request)
-    return await refresh_access_token(
-        db, refresh_data.refresh_token, device_info, ip_address
+    client = get_client_info(request)
+    result = await refresh_access_token(
+        db, refresh_data.refresh_token, client.device_info, client.ip_address
     )
+    return model_json_response(result)
 
 
-@router.post("/logout")
+@router.post("/logout", openapi_extra=json_body_openapi(LogoutRequest))
 async def logout(
-    logout_data: LogoutRequest,
+    logout_data: Annotated[LogoutRequest, Depends(json_body(LogoutRequest))],
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> dict:
@@ -89,17 +132,19 @@ async def logout(
     If logout_all is True, all refresh tokens for the user are revoked.
     """
     logout_all = logout_data.refresh_token is None
-    return await logout_user(
+    result = await logout_user(
         db, str(current_user.id), logout_data.refresh_token, logout_all
     )
+    invalidate_cached_user(current_user.id)
+    return result
 
 
 @router.get("/profile", response_model=UserResponse)
 async def read_user_profile(
     current_user: User = Depends(get_current_user),
-) -> UserResponse:
+) -> Response:
     """Get current user profile."""
-    return UserResponse.model_validate(current_user)
+    return model_json_response(user_to_response(current_user))
 
 
 # Google OAuth endpoints
@@ -127,11 +172,7 @@ async def google_login(request: Request) -> dict:
         redirect_uri = str(request.url_for("google_callback"))
 
     # Capture frontend origin (from the client request) to use on callback
-    frontend_base = settings.frontend_url
-    if settings.frontend_urls:
-        primary = settings.frontend_urls.split(",")[0].strip()
-        if primary:
-            frontend_base = primary
+    frontend_base = _DEFAULT_FRONTEND_BASE
     origin = request.headers.get("origin")
     if origin:
         frontend_base = origin
@@ -157,11 +198,7 @@ async def google_callback(
     Returns:
         RedirectResponse: Redirect to frontend with tokens or error
     """
-    frontend_base = request.session.get("frontend_base") or settings.frontend_url
-    if settings.frontend_urls and not request.session.get("frontend_base"):
-        primary = settings.frontend_urls.split(",")[0].strip()
-        if primary:
-            frontend_base = primary
+    frontend_base = request.session.get("frontend_base") or _DEFAULT_FRONTEND_BASE
     frontend_callback_url = f"{frontend_base}/auth/callback"
 
     try:
@@ -175,9 +212,9 @@ async def google_callback(
             raise ValueError("No user info returned from Google")
 
         # Authenticate or create user
-        device_info, ip_address = get_client_info(request)
+        client = get_client_info(request)
         token_response = await GoogleOAuthService.authenticate_or_create_user(
-            db, user_info, device_info, ip_address
+            db, user_info, client.device_info, client.ip_address
         )
 
         # Redirect to frontend with tokens in URL fragment (more secure than query params)
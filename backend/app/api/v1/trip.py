@@ -20,17 +20,29 @@ CRUD
   DELETE /trips/{id}             → Delete trip + versions + session
 """
 
-from typing import Annotated, Any, AsyncGenerator, Callable, Optional
-import json
+from typing import Annotated, Any, AsyncGenerator, Callable, Iterator, Optional
 import asyncio
+from hashlib import blake2b
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Request, Response, status, HTTPException
 from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.api.responses import model_json_response
+from app.api.sse import (
+    DELTA_PREFIX,
+    DONE_FRAME,
+    ERROR_PREFIX,
+    IMAGES_PREFIX,
+    META_PREFIX,
+    PLAN_META_PREFIX,
+    STATUS_PREFIX,
+    TOKEN_PREFIX,
+    sse_frame,
+)
 from app.db.models import User
 from app.schemas.trip import (
     AgentResponse,
@@ -39,43 +51,59 @@ from app.schemas.trip import (
     TripWithVersions,
     TripMessageResponse,
 )
+from app.services import agent_store
 from app.services import trip as trip_service
 
 router = APIRouter(prefix="/trips", tags=["trips"])
 
+# Keep-alive comment interval so proxies don't drop long planning streams.
+_SSE_PING_SECONDS = 15
+# Status updates are progress hints; a slow client only needs the latest few.
+_STATUS_QUEUE_MAXSIZE = 64
+
+
+def _chunk_text(text: str, size: int = 512) -> Iterator[str]:
+    """Yield delta-sized chunks of text for streaming."""
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
 
-def _chunk_text(text: str, size: int = 8) -> list[str]:
-    """Split text into smaller chunks for smoother streaming."""
-    return [text[i : i + size] for i in range(0, len(text), size)]
 
+def _put_latest(queue: asyncio.Queue[Optional[str]], item: Optional[str]) -> None:
+    """Enqueue ``item``, evicting the oldest entry if the queue is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
 
-def _make_status_callback(status_queue: asyncio.Queue[str]) -> Callable[[str], None]:
-    loop = asyncio.get_running_loop()
+
+def _make_status_callback(
+    status_queue: asyncio.Queue[Optional[str]],
+) -> Callable[[str], None]:
+    # Bound once: the callback fires from worker threads for every update.
+    call_soon_threadsafe = asyncio.get_running_loop().call_soon_threadsafe
 
     def _cb(message: str) -> None:
-        loop.call_soon_threadsafe(status_queue.put_nowait, message)
+        call_soon_threadsafe(_put_latest, status_queue, message)
 
     return _cb
 
 
 async def _stream_agent_response(
     response: AgentResponse,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     meta = {
         "trip_id": str(response.trip_id) if response.trip_id else None,
         "version_id": str(response.version_id) if response.version_id else None,
         "phase": response.phase,
         "has_high_risk": response.has_high_risk,
     }
-    yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+    yield sse_frame(META_PREFIX, meta)
 
-    # Stream the response with minimal delay for token-like feel
+    # The message is already complete, so flush it as fast as the client
+    # can take it; token-like pacing lives in the /token-stream endpoints.
     for chunk in _chunk_text(response.message):
-        payload = json.dumps({"text": chunk})
-        yield f"event: delta\ndata: {payload}\n\n"
-        await asyncio.sleep(0.02)  # 20ms delay for smooth streaming
+        yield sse_frame(DELTA_PREFIX, {"text": chunk})
 
-    yield "event: done\ndata: {}\n\n"
+    yield DONE_FRAME
 
 
 def _serialize_plan_meta(agent: Any) -> dict[str, Any] | None:
@@ -171,16 +199,17 @@ async def start_trip(
     body: StartTripRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AgentResponse:
+) -> Response:
     """Start a new trip planning conversation.
 
     The agent extracts origin / destination from the prompt.  If it can't,
     the response message asks for them and ``trip_id`` will be ``null`` —
     call this endpoint again with a more complete prompt.
     """
-    return await trip_service.start_trip_conversation(
+    result = await trip_service.start_trip_conversation(
         db, current_user.id, body.prompt, vibe=body.vibe
     )
+    return model_json_response(result, status.HTTP_201_CREATED)
 
 
 @router.post("/start/stream")
@@ -188,50 +217,59 @@ async def start_trip_stream(
     body: StartTripRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
-    # Early rate-limit check for free users to return a proper 429
-    await trip_service._enforce_plan_limit(db, current_user.id)
-
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
+) -> EventSourceResponse:
+    # The plan limit is enforced by start_trip_conversation itself; a 429
+    # surfaces as an error event so the response headers aren't held back.
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
 
     async def runner() -> AgentResponse:
-        return await trip_service.start_trip_conversation(
-            db,
-            current_user.id,
-            body.prompt,
-            vibe=body.vibe,
-            on_status=_make_status_callback(status_queue),
-        )
+        try:
+            return await trip_service.start_trip_conversation(
+                db,
+                current_user.id,
+                body.prompt,
+                vibe=body.vibe,
+                on_status=_make_status_callback(status_queue),
+            )
+        finally:
+            # Wake the generator; None marks the end of status updates.
+            _put_latest(status_queue, None)
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
-            while not task.done():
-                try:
-                    status_msg = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
-                except asyncio.TimeoutError:
-                    continue
+            while True:
+                status_msg = await status_queue.get()
+                if status_msg is None:
+                    break
+                yield sse_frame(STATUS_PREFIX, {"text": status_msg})
+
+            # The service call is finished; return the pooled connection
+            # now rather than holding it while the reply streams out.
+            await db.close()
 
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield sse_frame(ERROR_PREFIX, error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 @router.post("/{trip_id}/clarify", response_model=AgentResponse)
@@ -240,16 +278,17 @@ async def clarify_trip(
     body: ClarifyRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AgentResponse:
+) -> Response:
     """Submit answers to the clarification questions.
 
     Triggers the feasibility analysis.  The ``has_high_risk`` flag in the
     response tells the frontend whether to show a proceed/cancel dialog
     before calling ``/proceed``.
     """
-    return await trip_service.submit_clarification(
+    result = await trip_service.submit_clarification(
         db, trip_id, current_user.id, body.answers
     )
+    return model_json_response(result)
 
 
 @router.post("/{trip_id}/clarify/stream")
@@ -258,47 +297,57 @@ async def clarify_trip_stream(
     body: ClarifyRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
+) -> EventSourceResponse:
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
 
     async def runner() -> AgentResponse:
-        return await trip_service.submit_clarification(
-            db,
-            trip_id,
-            current_user.id,
-            body.answers,
-            on_status=_make_status_callback(status_queue),
-        )
+        try:
+            return await trip_service.submit_clarification(
+                db,
+                trip_id,
+                current_user.id,
+                body.answers,
+                on_status=_make_status_callback(status_queue),
+            )
+        finally:
+            # Wake the generator; None marks the end of status updates.
+            _put_latest(status_queue, None)
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
-            while not task.done():
-                try:
-                    status_msg = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
-                except asyncio.TimeoutError:
-                    continue
+            while True:
+                status_msg = await status_queue.get()
+                if status_msg is None:
+                    break
+                yield sse_frame(STATUS_PREFIX, {"text": status_msg})
+
+            # The service call is finished; return the pooled connection
+            # now rather than holding it while the reply streams out.
+            await db.close()
 
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield sse_frame(ERROR_PREFIX, error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 @router.post("/{trip_id}/proceed", response_model=AgentResponse)
@@ -307,7 +356,7 @@ async def proceed_trip(
     body: ProceedRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AgentResponse:
+) -> Response:
     """Proceed (or not) after feasibility and generate planning assumptions.
 
     * If the previous ``/clarify`` response had ``has_high_risk=true``,
@@ -315,9 +364,10 @@ async def proceed_trip(
     * If ``has_high_risk`` was ``false``, call with ``proceed=true`` to
       advance to the assumptions phase.
     """
-    return await trip_service.proceed_after_feasibility(
+    result = await trip_service.proceed_after_feasibility(
         db, trip_id, current_user.id, body.proceed
     )
+    return model_json_response(result)
 
 
 @router.post("/{trip_id}/proceed/stream")
@@ -326,47 +376,57 @@ async def proceed_trip_stream(
     body: ProceedRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
+) -> EventSourceResponse:
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
 
     async def runner() -> AgentResponse:
-        return await trip_service.proceed_after_feasibility(
-            db,
-            trip_id,
-            current_user.id,
-            body.proceed,
-            on_status=_make_status_callback(status_queue),
-        )
+        try:
+            return await trip_service.proceed_after_feasibility(
+                db,
+                trip_id,
+                current_user.id,
+                body.proceed,
+                on_status=_make_status_callback(status_queue),
+            )
+        finally:
+            # Wake the generator; None marks the end of status updates.
+            _put_latest(status_queue, None)
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
-            while not task.done():
-                try:
-                    status_msg = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
-                except asyncio.TimeoutError:
-                    continue
+            while True:
+                status_msg = await status_queue.get()
+                if status_msg is None:
+                    break
+                yield sse_frame(STATUS_PREFIX, {"text": status_msg})
+
+            # The service call is finished; return the pooled connection
+            # now rather than holding it while the reply streams out.
+            await db.close()
 
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield sse_frame(ERROR_PREFIX, error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 @router.post("/{trip_id}/assumptions", response_model=AgentResponse)
@@ -375,13 +435,13 @@ async def confirm_assumptions(
     body: AssumptionsRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AgentResponse:
+) -> Response:
     """Confirm or adjust assumptions, then generate the full itinerary.
 
     This is the longest-running call — the agent researches current
     prices and builds a day-by-day plan with budget breakdown.
     """
-    return await trip_service.confirm_trip_assumptions(
+    result = await trip_service.confirm_trip_assumptions(
         db,
         trip_id,
         current_user.id,
@@ -389,6 +449,7 @@ async def confirm_assumptions(
         modifications=body.modifications,
         additional_interests=body.additional_interests,
     )
+    return model_json_response(result)
 
 
 @router.post("/{trip_id}/assumptions/stream")
@@ -397,49 +458,59 @@ async def confirm_assumptions_stream(
     body: AssumptionsRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
+) -> EventSourceResponse:
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
 
     async def runner() -> AgentResponse:
-        return await trip_service.confirm_trip_assumptions(
-            db,
-            trip_id,
-            current_user.id,
-            body.confirmed,
-            modifications=body.modifications,
-            additional_interests=body.additional_interests,
-            on_status=_make_status_callback(status_queue),
-        )
+        try:
+            return await trip_service.confirm_trip_assumptions(
+                db,
+                trip_id,
+                current_user.id,
+                body.confirmed,
+                modifications=body.modifications,
+                additional_interests=body.additional_interests,
+                on_status=_make_status_callback(status_queue),
+            )
+        finally:
+            # Wake the generator; None marks the end of status updates.
+            _put_latest(status_queue, None)
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
-            while not task.done():
-                try:
-                    status_msg = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
-                except asyncio.TimeoutError:
-                    continue
+            while True:
+                status_msg = await status_queue.get()
+                if status_msg is None:
+                    break
+                yield sse_frame(STATUS_PREFIX, {"text": status_msg})
+
+            # The service call is finished; return the pooled connection
+            # now rather than holding it while the reply streams out.
+            await db.close()
 
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield sse_frame(ERROR_PREFIX, error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 @router.post("/{trip_id}/refine", response_model=AgentResponse)
@@ -448,14 +519,15 @@ async def refine_trip(
     body: RefineRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AgentResponse:
+) -> Response:
     """Request a refinement of the generated plan.
 
     Can be called multiple times. Each call updates the same TripVersion.
     """
-    return await trip_service.refine_trip_plan(
+    result = await trip_service.refine_trip_plan(
         db, trip_id, current_user.id, body.refinement_type
     )
+    return model_json_response(result)
 
 
 @router.post("/{trip_id}/refine/stream")
@@ -464,49 +536,58 @@ async def refine_trip_stream(
     body: RefineRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
+) -> EventSourceResponse:
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
 
     async def runner() -> AgentResponse:
-        return await trip_service.refine_trip_plan(
-            db,
-            trip_id,
-            current_user.id,
-            body.refinement_type,
-            on_status=_make_status_callback(status_queue),
-        )
+        try:
+            return await trip_service.refine_trip_plan(
+                db,
+                trip_id,
+                current_user.id,
+                body.refinement_type,
+                on_status=_make_status_callback(status_queue),
+            )
+        finally:
+            # Wake the generator; None marks the end of status updates.
+            _put_latest(status_queue, None)
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
-            while not task.done():
-                try:
-                    status = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    payload = json.dumps({"text": status})
-                    yield f"event: status\ndata: {payload}\n\n"
-                except asyncio.TimeoutError:
-                    continue
+            while True:
+                status_msg = await status_queue.get()
+                if status_msg is None:
+                    break
+                yield sse_frame(STATUS_PREFIX, {"text": status_msg})
+
+            # The service call is finished; return the pooled connection
+            # now rather than holding it while the reply streams out.
+            await db.close()
 
             # Check if task raised an exception
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield sse_frame(ERROR_PREFIX, error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 # ---------------------------------------------------------------------------
@@ -520,16 +601,18 @@ async def clarify_trip_token_stream(
     body: ClarifyRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
+) -> EventSourceResponse:
     """Submit clarification answers with token-by-token streaming."""
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
     token_queue: asyncio.Queue[str] = asyncio.Queue[str]()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         try:
             # Ownership and validity check
             await trip_service._get_user_trip(db, trip_id, current_user.id)
-            agent = trip_service._get_agent(trip_id)
+            agent = await agent_store.load(trip_id)
             version = await trip_service._latest_version(db, trip_id)
 
             # Send initial meta before streaming tokens
@@ -539,7 +622,7 @@ async def clarify_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+            yield sse_frame(META_PREFIX, meta)
 
             loop = asyncio.get_running_loop()
             agent.on_status = _make_status_callback(status_queue)
@@ -559,11 +642,11 @@ async def clarify_trip_token_stream(
             ):
                 while not status_queue.empty():
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield sse_frame(STATUS_PREFIX, {"text": status_msg})
 
                 while not token_queue.empty():
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield sse_frame(TOKEN_PREFIX, {"text": token})
 
                 await asyncio.sleep(0.02)
 
@@ -581,7 +664,7 @@ async def clarify_trip_token_stream(
 
             plan_meta_payload = _serialize_plan_meta(agent)
             if plan_meta_payload:
-                yield f"event: plan_meta\ndata: {json.dumps(plan_meta_payload)}\n\n"
+                yield sse_frame(PLAN_META_PREFIX, plan_meta_payload)
 
             # Send FINAL meta with updated phase
             final_meta = {
@@ -591,15 +674,15 @@ async def clarify_trip_token_stream(
                 "has_high_risk": agent.state.phase.value == "feasibility"
                 and agent.state.awaiting_confirmation,
             }
-            yield f"event: meta\ndata: {json.dumps(final_meta)}\n\n"
+            yield sse_frame(META_PREFIX, final_meta)
 
-            yield "event: done\ndata: {}\n\n"
+            yield DONE_FRAME
 
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 @router.post("/{trip_id}/proceed/token-stream")
@@ -608,16 +691,18 @@ async def proceed_trip_token_stream(
     body: ProceedRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
+) -> EventSourceResponse:
     """Handle proceed decision with token-by-token streaming."""
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
     token_queue: asyncio.Queue[str] = asyncio.Queue[str]()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         try:
             # Ownership and validity check
             await trip_service._get_user_trip(db, trip_id, current_user.id)
-            agent = trip_service._get_agent(trip_id)
+            agent = await agent_store.load(trip_id)
             version = await trip_service._latest_version(db, trip_id)
 
             loop = asyncio.get_running_loop()
@@ -639,7 +724,7 @@ async def proceed_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+            yield sse_frame(META_PREFIX, meta)
 
             task = asyncio.create_task(asyncio.to_thread(run))
 
@@ -648,11 +733,11 @@ async def proceed_trip_token_stream(
             ):
                 while not status_queue.empty():
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield sse_frame(STATUS_PREFIX, {"text": status_msg})
 
                 while not token_queue.empty():
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield sse_frame(TOKEN_PREFIX, {"text": token})
 
                 await asyncio.sleep(0.02)
 
@@ -673,7 +758,7 @@ async def proceed_trip_token_stream(
 
             plan_meta_payload = _serialize_plan_meta(agent)
             if plan_meta_payload:
-                yield f"event: plan_meta\ndata: {json.dumps(plan_meta_payload)}\n\n"
+                yield sse_frame(PLAN_META_PREFIX, plan_meta_payload)
 
             # Send FINAL meta with updated phase
             final_meta = {
@@ -682,15 +767,15 @@ async def proceed_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(final_meta)}\n\n"
+            yield sse_frame(META_PREFIX, final_meta)
 
-            yield "event: done\ndata: {}\n\n"
+            yield DONE_FRAME
 
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 @router.post("/{trip_id}/assumptions/token-stream")
@@ -699,16 +784,18 @@ async def confirm_assumptions_token_stream(
     body: AssumptionsRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
+) -> EventSourceResponse:
     """Confirm assumptions with token-by-token streaming."""
-    status_queue: asyncio.Queue[str] = asyncio.Queue[str]()
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
     token_queue: asyncio.Queue[str] = asyncio.Queue[str]()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         try:
             # Ownership and validity check
             await trip_service._get_user_trip(db, trip_id, current_user.id)
-            agent = trip_service._get_agent(trip_id)
+            agent = await agent_store.load(trip_id)
             version = await trip_service._latest_version(db, trip_id)
 
             loop = asyncio.get_running_loop()
@@ -734,12 +821,12 @@ async def confirm_assumptions_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+            yield sse_frame(META_PREFIX, meta)
 
             # Send destination images if available (for carousel)
             dest_images = agent.get_destination_images()
             if dest_images:
-                yield f"event: images\ndata: {json.dumps({'images': dest_images})}\n\n"
+                yield sse_frame(IMAGES_PREFIX, {"images": dest_images})
 
             task = asyncio.create_task(asyncio.to_thread(run))
 
@@ -748,11 +835,11 @@ async def confirm_assumptions_token_stream(
             ):
                 while not status_queue.empty():
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield sse_frame(STATUS_PREFIX, {"text": status_msg})
 
                 while not token_queue.empty():
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield sse_frame(TOKEN_PREFIX, {"text": token})
 
                 await asyncio.sleep(0.02)
 
@@ -785,7 +872,7 @@ async def confirm_assumptions_token_stream(
 
             plan_meta_payload = _serialize_plan_meta(agent)
             if plan_meta_payload:
-                yield f"event: plan_meta\ndata: {json.dumps(plan_meta_payload)}\n\n"
+                yield sse_frame(PLAN_META_PREFIX, plan_meta_payload)
 
             # Send FINAL meta with updated phase
             final_meta = {
@@ -794,15 +881,15 @@ async def confirm_assumptions_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(final_meta)}\n\n"
+            yield sse_frame(META_PREFIX, final_meta)
 
-            yield "event: done\ndata: {}\n\n"
+            yield DONE_FRAME
 
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 @router.post("/{trip_id}/refine/token-stream")
@@ -811,16 +898,18 @@ async def refine_trip_token_stream(
     body: RefineRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> StreamingResponse:
+) -> EventSourceResponse:
     """Refine plan with token-by-token streaming."""
-    status_queue: asyncio.Queue[str] = asyncio.Queue[str]()
+    status_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(
+        maxsize=_STATUS_QUEUE_MAXSIZE
+    )
     token_queue: asyncio.Queue[str] = asyncio.Queue[str]()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         try:
             # Ownership and validity check
             await trip_service._get_user_trip(db, trip_id, current_user.id)
-            agent = trip_service._get_agent(trip_id)
+            agent = await agent_store.load(trip_id)
             version = await trip_service._latest_version(db, trip_id)
 
             loop = asyncio.get_running_loop()
@@ -842,7 +931,7 @@ async def refine_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+            yield sse_frame(META_PREFIX, meta)
 
             task = asyncio.create_task(asyncio.to_thread(run))
 
@@ -851,11 +940,11 @@ async def refine_trip_token_stream(
             ):
                 while not status_queue.empty():
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield sse_frame(STATUS_PREFIX, {"text": status_msg})
 
                 while not token_queue.empty():
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield sse_frame(TOKEN_PREFIX, {"text": token})
 
                 await asyncio.sleep(0.02)
 
@@ -873,7 +962,7 @@ async def refine_trip_token_stream(
 
             plan_meta_payload = _serialize_plan_meta(agent)
             if plan_meta_payload:
-                yield f"event: plan_meta\ndata: {json.dumps(plan_meta_payload)}\n\n"
+                yield sse_frame(PLAN_META_PREFIX, plan_meta_payload)
 
             # Send FINAL meta with updated phase
             final_meta = {
@@ -882,15 +971,15 @@ async def refine_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(final_meta)}\n\n"
+            yield sse_frame(META_PREFIX, final_meta)
 
-            yield "event: done\ndata: {}\n\n"
+            yield DONE_FRAME
 
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield sse_frame(ERROR_PREFIX, error_payload)
 
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return EventSourceResponse(generator(), ping=_SSE_PING_SECONDS, sep="\n")
 
 
 # ---------------------------------------------------------------------------
@@ -898,12 +987,45 @@ async def refine_trip_token_stream(
 # ---------------------------------------------------------------------------
 
 
+def _make_etag(*parts: object) -> str:
+    """Hash a fingerprint tuple into a strong ETag value."""
+    digest = blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_headers(etag: str) -> dict[str, str]:
+    # Per-user data: let the browser keep it, but always revalidate.
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already holds ``etag``."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=_etag_headers(etag)
+        )
+    return None
+
+
 @router.get("", response_model=list[TripSummary])
 async def list_trips(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[TripSummary]:
-    """List all trips for the authenticated user (newest first)."""
+    request: Request,
+    response: Response,
+) -> list[TripSummary] | Response:
+    """List all trips for the authenticated user (newest first).
+
+    Answers ``304 Not Modified`` when the client's ``If-None-Match``
+    matches the current list fingerprint, skipping the full query.
+    """
+    fingerprint = await trip_service.get_trips_fingerprint(db, current_user.id)
+    etag = _make_etag(current_user.id, *fingerprint)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    response.headers.update(_etag_headers(etag))
     return await trip_service.list_user_trips(db, current_user.id)
 
 
@@ -922,8 +1044,22 @@ async def get_trip_versions(
     trip_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> TripWithVersions:
-    """Get a trip with all its version history."""
+    request: Request,
+    response: Response,
+) -> TripWithVersions | Response:
+    """Get a trip with all its version history.
+
+    Supports ``If-None-Match`` revalidation like ``GET /trips``.
+    """
+    fingerprint = await trip_service.get_trip_versions_fingerprint(
+        db, trip_id, current_user.id
+    )
+    if fingerprint is not None:
+        etag = _make_etag(trip_id, *fingerprint)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        response.headers.update(_etag_headers(etag))
     return await trip_service.get_trip_version_history(db, trip_id, current_user.id)
 
 
@@ -1,7 +1,6 @@
 """Streaming trip API endpoints for token-by-token responses with phase tracking."""
 
 import asyncio
-import json
 from typing import Annotated, AsyncGenerator, Callable
 from uuid import UUID
 
@@ -11,6 +10,14 @@ from fastapi.responses import StreamingResponse
 from app.agent.agent import TravelAgent
 from app.agent.models import Phase
 from app.api.deps import get_current_user
+from app.api.sse import (
+    DONE_FRAME,
+    ERROR_PREFIX,
+    META_PREFIX,
+    STATUS_PREFIX,
+    TOKEN_PREFIX,
+    sse_frame,
+)
 from app.config import get_settings
 from app.db.models import User
 
@@ -53,14 +60,14 @@ async def start_trip_stream(
     status_queue: asyncio.Queue[str] = asyncio.Queue()
     phase_queue: asyncio.Queue[str] = asyncio.Queue()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         agent = TravelAgent(
             api_key=settings.openrouter_api_key,
             on_status=_make_status_callback(status_queue),
             on_token=_make_token_callback(token_queue),
         )
 
-        yield f"event: meta\ndata: {json.dumps({'phase': 'clarification', 'has_high_risk': False})}\n\n"
+        yield sse_frame(META_PREFIX, {"phase": "clarification", "has_high_risk": False})
 
         loop = asyncio.get_event_loop()
 
@@ -79,30 +86,33 @@ async def start_trip_stream(
                     new_phase = phase_queue.get_nowait()
                     if new_phase != current_phase:
                         current_phase = new_phase
-                        yield f"event: meta\ndata: {json.dumps({'phase': current_phase, 'has_high_risk': False})}\n\n"
+                        yield sse_frame(
+                            META_PREFIX,
+                            {"phase": current_phase, "has_high_risk": False},
+                        )
                 except asyncio.QueueEmpty:
                     pass
 
                 try:
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield sse_frame(STATUS_PREFIX, {"text": status_msg})
                 except asyncio.QueueEmpty:
                     pass
 
                 try:
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield sse_frame(TOKEN_PREFIX, {"text": token})
                 except asyncio.QueueEmpty:
                     await asyncio.sleep(0.01)
 
             while not token_queue.empty():
                 token = token_queue.get_nowait()
-                yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                yield sse_frame(TOKEN_PREFIX, {"text": token})
 
-            yield "event: done\ndata: {}\n\n"
+            yield DONE_FRAME
 
         except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            yield sse_frame(ERROR_PREFIX, {"error": str(e)})
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -125,14 +135,14 @@ async def clarify_trip_stream(
     status_queue: asyncio.Queue[str] = asyncio.Queue()
     phase_queue: asyncio.Queue[str] = asyncio.Queue()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         agent = TravelAgent(
             api_key=settings.openrouter_api_key,
             on_status=_make_status_callback(status_queue),
             on_token=_make_token_callback(token_queue),
         )
 
-        yield f"event: meta\ndata: {json.dumps({'phase': 'feasibility', 'has_high_risk': False})}\n\n"
+        yield sse_frame(META_PREFIX, {"phase": "feasibility", "has_high_risk": False})
 
         loop = asyncio.get_event_loop()
 
@@ -151,30 +161,33 @@ async def clarify_trip_stream(
                     new_phase = phase_queue.get_nowait()
                     if new_phase != current_phase:
                         current_phase = new_phase
-                        yield f"event: meta\ndata: {json.dumps({'phase': current_phase, 'has_high_risk': False})}\n\n"
+                        yield sse_frame(
+                            META_PREFIX,
+                            {"phase": current_phase, "has_high_risk": False},
+                        )
                 except asyncio.QueueEmpty:
                     pass
 
                 try:
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield sse_frame(STATUS_PREFIX, {"text": status_msg})
                 except asyncio.QueueEmpty:
                     pass
 
                 try:
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield sse_frame(TOKEN_PREFIX, {"text": token})
                 except asyncio.QueueEmpty:
                     await asyncio.sleep(0.01)
 
             while not token_queue.empty():
                 token = token_queue.get_nowait()
-                yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                yield sse_frame(TOKEN_PREFIX, {"text": token})
 
-            yield "event: done\ndata: {}\n\n"
+            yield DONE_FRAME
 
         except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            yield sse_frame(ERROR_PREFIX, {"error": str(e)})
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -195,14 +208,14 @@ async def generate_plan_stream(
     status_queue: asyncio.Queue[str] = asyncio.Queue()
     phase_queue: asyncio.Queue[str] = asyncio.Queue()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         agent = TravelAgent(
             api_key=settings.openrouter_api_key,
             on_status=_make_status_callback(status_queue),
             on_token=_make_token_callback(token_queue),
         )
 
-        yield f"event: meta\ndata: {json.dumps({'phase': 'planning', 'has_high_risk': False})}\n\n"
+        yield sse_frame(META_PREFIX, {"phase": "planning", "has_high_risk": False})
 
         loop = asyncio.get_event_loop()
 
@@ -223,30 +236,33 @@ async def generate_plan_stream(
                     new_phase = phase_queue.get_nowait()
                     if new_phase != current_phase:
                         current_phase = new_phase
-                        yield f"event: meta\ndata: {json.dumps({'phase': current_phase, 'has_high_risk': False})}\n\n"
+                        yield sse_frame(
+                            META_PREFIX,
+                            {"phase": current_phase, "has_high_risk": False},
+                        )
                 except asyncio.QueueEmpty:
                     pass
 
                 try:
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield sse_frame(STATUS_PREFIX, {"text": status_msg})
                 except asyncio.QueueEmpty:
                     pass
 
                 try:
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield sse_frame(TOKEN_PREFIX, {"text": token})
                 except asyncio.QueueEmpty:
                     await asyncio.sleep(0.01)
 
             while not token_queue.empty():
                 token = token_queue.get_nowait()
-                yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                yield sse_frame(TOKEN_PREFIX, {"text": token})
 
-            yield "event: done\ndata: {}\n\n"
+            yield DONE_FRAME
 
         except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            yield sse_frame(ERROR_PREFIX, {"error": str(e)})
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -269,14 +285,14 @@ async def refine_plan_token_stream(
     status_queue: asyncio.Queue[str] = asyncio.Queue()
     phase_queue: asyncio.Queue[str] = asyncio.Queue()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         agent = TravelAgent(
             api_key=settings.openrouter_api_key,
             on_status=_make_status_callback(status_queue),
             on_token=_make_token_callback(token_queue),
         )
 
-        yield f"event: meta\ndata: {json.dumps({'phase': 'refinement', 'has_high_risk': False})}\n\n"
+        yield sse_frame(META_PREFIX, {"phase": "refinement", "has_high_risk": False})
 
         loop = asyncio.get_event_loop()
 
@@ -295,29 +311,32 @@ async def refine_plan_token_stream(
                     new_phase = phase_queue.get_nowait()
                     if new_phase != current_phase:
                         current_phase = new_phase
-                        yield f"event: meta\ndata: {json.dumps({'phase': current_phase, 'has_high_risk': False})}\n\n"
+                        yield sse_frame(
+                            META_PREFIX,
+                            {"phase": current_phase, "has_high_risk": False},
+                        )
                 except asyncio.QueueEmpty:
                     pass
 
                 try:
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield sse_frame(STATUS_PREFIX, {"text": status_msg})
                 except asyncio.QueueEmpty:
                     pass
 
                 try:
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield sse_frame(TOKEN_PREFIX, {"text": token})
                 except asyncio.QueueEmpty:
                     await asyncio.sleep(0.01)
 
             while not token_queue.empty():
                 token = token_queue.get_nowait()
-                yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                yield sse_frame(TOKEN_PREFIX, {"text": token})
 
-            yield "event: done\ndata: {}\n\n"
+            yield DONE_FRAME
 
         except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            yield sse_frame(ERROR_PREFIX, {"error": str(e)})
 
     return StreamingResponse(generator(), media_type="text/event-stream")
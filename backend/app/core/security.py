@@ -1,18 +1,170 @@
 """Security utilities."""
 
+import asyncio
+import base64
 import hashlib
+import hmac
+import os
 import secrets
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any, Union
 import jwt
+import orjson
+from jwt.exceptions import InvalidJTIError, InvalidSubjectError
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
 from app.config import get_settings
 
 settings = get_settings()
 
-# Modern Argon2 password hasher using recommended settings
-pwd_hasher = PasswordHash.recommended()
+# Argon2id password hasher with explicitly configured cost parameters. Hashes
+# encode their own parameters, so existing passwords still verify after tuning.
+pwd_hasher = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=settings.argon2_time_cost,
+            memory_cost=settings.argon2_memory_cost_kib,
+            parallelism=settings.argon2_parallelism,
+            hash_len=32,
+        ),
+    )
+)
+
+# Argon2 work is capped at one hash per core so a burst of logins or signups
+# cannot occupy every default worker thread the rest of the app relies on.
+_PASSWORD_HASH_SLOTS = asyncio.Semaphore(os.cpu_count() or 1)
+
+# Token helpers run on every authenticated request, so resolve keys, algorithm
+# lists and lifetimes once at import time.
+_ALGORITHM = settings.algorithm
+_ACCESS_TOKEN_SECRET = settings.secret_key_bytes
+_ALGORITHMS = [_ALGORITHM]
+_ACCESS_TOKEN_OPTIONS = {"require": ["sub", "exp"]}
+_ACCESS_TOKEN_LIFETIME = timedelta(minutes=settings.access_token_expire_minutes)
+# Separate refresh secret if configured, otherwise the main secret
+_REFRESH_TOKEN_SECRET = settings.refresh_token_secret_key_bytes
+_REFRESH_TOKEN_LIFETIME = timedelta(minutes=settings.refresh_token_expire_minutes)
+
+# Tokens are always HS256 with a server-side key, so verification can skip
+# PyJWT's algorithm negotiation and option handling (see _decode_hs256).
+_USE_HS256_FAST_PATH = _ALGORITHM == "HS256"
+_ACCESS_TOKEN_REQUIRED_CLAIMS = ("sub", "exp")
+
+# Copying an initialised hash object skips the per-call digest lookup that the
+# hashlib.sha256() constructor goes through.
+_SHA256_PROTOTYPE = hashlib.sha256()
+
+# Warm clients present the same bearer token on every request. Decoded payloads
+# are remembered for a few seconds, never past the token's own expiry, so
+# repeat requests skip the signature check. Failed decodes are never cached.
+_ACCESS_TOKEN_CACHE_TTL_SECONDS = 5.0
+_ACCESS_TOKEN_CACHE_MAX_SIZE = 10_000
+_access_token_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+def _int_claim(payload: dict[str, Any], claim: str, error: jwt.PyJWTError) -> int:
+    """Coerce a time claim like PyJWT does, raising ``error`` if it can't."""
+    try:
+        return int(payload[claim])
+    except (TypeError, ValueError):
+        raise error from None
+
+
+def _decode_hs256(
+    token: str, secret: bytes, required: tuple[str, ...] = ()
+) -> dict[str, Any]:
+    """Verify and decode a compact HS256 JWT.
+
+    Mirrors ``jwt.decode(token, secret, algorithms=["HS256"])`` step for step
+    (segment parsing, ``alg`` header, signature, required claims, then the
+    ``iat`` / ``nbf`` / ``exp`` / ``aud`` / ``sub`` / ``jti`` checks) and raises
+    the same ``jwt.PyJWTError`` subclasses. The one deviation is that
+    non-numeric time claims of the wrong JSON type (lists, objects) raise the
+    claim's error rather than a bare ``TypeError``.
+
+    Args:
+        token: Encoded JWT (``header.payload.signature``).
+        secret: HMAC key.
+        required: Claims that must be present in the payload.
+
+    Returns:
+        The decoded payload.
+    """
+    try:
+        signing_input, signature_segment = token.encode().rsplit(b".", 1)
+        header_segment, payload_segment = signing_input.split(b".", 1)
+    except ValueError as exc:
+        raise jwt.DecodeError("Not enough segments") from exc
+    try:
+        header = orjson.loads(_b64url_decode(header_segment))
+    except ValueError as exc:
+        raise jwt.DecodeError("Invalid header string") from exc
+    if not isinstance(header, dict):
+        raise jwt.DecodeError("Invalid header string: must be a json object")
+    try:
+        payload_bytes = _b64url_decode(payload_segment)
+        signature = _b64url_decode(signature_segment)
+    except ValueError as exc:
+        raise jwt.DecodeError("Invalid payload or crypto padding") from exc
+
+    if "alg" not in header:
+        raise jwt.InvalidAlgorithmError("Algorithm not specified")
+    if header["alg"] != "HS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+    expected = hmac.new(secret, signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(signature, expected):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(payload_bytes)
+    except ValueError as exc:
+        raise jwt.DecodeError("Invalid payload string") from exc
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+
+    for claim in required:
+        if payload.get(claim) is None:
+            raise jwt.MissingRequiredClaimError(claim)
+
+    now = time.time()
+    if "iat" in payload:
+        iat = _int_claim(
+            payload,
+            "iat",
+            jwt.InvalidIssuedAtError("Issued At claim (iat) must be an integer."),
+        )
+        if iat > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+    if "nbf" in payload:
+        nbf = _int_claim(
+            payload,
+            "nbf",
+            jwt.DecodeError("Not Before claim (nbf) must be an integer."),
+        )
+        if nbf > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "exp" in payload:
+        exp = _int_claim(
+            payload,
+            "exp",
+            jwt.DecodeError("Expiration Time claim (exp) must be an integer."),
+        )
+        if exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+
+    if payload.get("aud"):
+        raise jwt.InvalidAudienceError("Invalid audience")
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        raise InvalidSubjectError("Subject must be a string")
+    if "jti" in payload and not isinstance(payload["jti"], str):
+        raise InvalidJTIError("JWT ID must be a string")
+    return payload
 
 
 def generate_refresh_token() -> str:
@@ -22,17 +174,10 @@ def generate_refresh_token() -> str:
 
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta) -> str:
     """Create a JWT access token."""
-    if expires_delta:
-        expire = datetime.now(tz=UTC) + expires_delta
-    else:
-        expire = datetime.now(tz=UTC) + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+    expire = datetime.now(tz=UTC) + (expires_delta or _ACCESS_TOKEN_LIFETIME)
 
     to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(
-        to_encode, settings.secret_key.get_secret_value(), algorithm=settings.algorithm
-    )
+    encoded_jwt = jwt.encode(to_encode, _ACCESS_TOKEN_SECRET, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
@@ -41,54 +186,90 @@ def verify_access_token(token: str) -> dict[str, Any]:
 
     Returns the payload if valid, raises JWTError if invalid.
     """
-    return jwt.decode(
-        token,
-        settings.secret_key.get_secret_value(),
-        algorithms=[settings.algorithm],
+    now = time.time()
+    cached = _access_token_cache.get(token)
+    if cached is not None:
+        valid_until, payload = cached
+        if now < valid_until:
+            # Copy so a caller mutating its payload can't alter the cache.
+            return dict(payload)
+        del _access_token_cache[token]
+
+    if _USE_HS256_FAST_PATH:
+        payload = _decode_hs256(
+            token, _ACCESS_TOKEN_SECRET, _ACCESS_TOKEN_REQUIRED_CLAIMS
+        )
+    else:
+        payload = jwt.decode(
+            token,
+            _ACCESS_TOKEN_SECRET,
+            algorithms=_ALGORITHMS,
+            options=_ACCESS_TOKEN_OPTIONS,
+        )
+
+    if len(_access_token_cache) >= _ACCESS_TOKEN_CACHE_MAX_SIZE:
+        _access_token_cache.clear()
+    _access_token_cache[token] = (
+        min(float(payload["exp"]), now + _ACCESS_TOKEN_CACHE_TTL_SECONDS),
+        payload,
     )
+    return dict(payload)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash."""
+    """Verify a password against a hash.
+
+    CPU- and memory-bound; async code should await the ``_async`` variant.
+    """
     return pwd_hasher.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password."""
+    """Hash a password.
+
+    CPU- and memory-bound; async code should await the ``_async`` variant.
+    """
     return pwd_hasher.hash(password)
 
 
-def hash_refresh_token(token: str) -> str:
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread, bounded to one job per core."""
+    async with _PASSWORD_HASH_SLOTS:
+        return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in a worker thread, bounded to one job per core."""
+    async with _PASSWORD_HASH_SLOTS:
+        return await asyncio.to_thread(get_password_hash, password)
+
+
+def hash_refresh_token(token: str) -> bytes:
     """Hash a refresh token for secure database storage.
 
     Uses SHA-256 to create a deterministic hash that can be used for lookups.
+    The raw 32-byte digest is stored (``bytea``), half the size of hex text.
     """
-    return hashlib.sha256(token.encode()).hexdigest()
+    digest = _SHA256_PROTOTYPE.copy()
+    digest.update(token.encode())
+    return digest.digest()
 
 
-def verify_refresh_token_hash(token: str, token_hash: str) -> bool:
+def verify_refresh_token_hash(token: str, token_hash: bytes) -> bool:
     """Verify a refresh token against its stored hash."""
-    return hash_refresh_token(token) == token_hash
+    return hmac.compare_digest(hash_refresh_token(token), token_hash)
 
 
 def create_refresh_token_jwt(subject: Union[str, Any]) -> str:
     """Create a JWT refresh token with long expiry."""
-    expire = datetime.now(tz=UTC) + timedelta(
-        minutes=settings.refresh_token_expire_minutes
-    )
+    expire = datetime.now(tz=UTC) + _REFRESH_TOKEN_LIFETIME
     to_encode = {
         "exp": expire,
         "sub": str(subject),
         "type": "refresh",  # Distinguish from access tokens
         "jti": secrets.token_hex(8),  # Unique identifier to prevent collisions
     }
-    # Use separate secret key if configured, otherwise fall back to main secret
-    secret = (
-        settings.refresh_token_secret_key.get_secret_value()
-        if settings.refresh_token_secret_key
-        else settings.secret_key.get_secret_value()
-    )
-    encoded_jwt = jwt.encode(to_encode, secret, algorithm=settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, _REFRESH_TOKEN_SECRET, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
@@ -97,13 +278,10 @@ def verify_refresh_token_jwt(token: str) -> dict[str, Any]:
 
     Returns the payload if valid, raises JWTError if invalid.
     """
-    # Use separate secret key if configured, otherwise fall back to main secret
-    secret = (
-        settings.refresh_token_secret_key.get_secret_value()
-        if settings.refresh_token_secret_key
-        else settings.secret_key.get_secret_value()
-    )
-    payload = jwt.decode(token, secret, algorithms=[settings.algorithm])
+    if _USE_HS256_FAST_PATH:
+        payload = _decode_hs256(token, _REFRESH_TOKEN_SECRET)
+    else:
+        payload = jwt.decode(token, _REFRESH_TOKEN_SECRET, algorithms=_ALGORITHMS)
     # Verify this is actually a refresh token
     if payload.get("type") != "refresh":
         raise jwt.PyJWTError("Invalid token type")
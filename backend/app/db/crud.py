@@ -1,10 +1,12 @@
 from uuid import UUID
+from collections.abc import Iterator
 from typing import Any
 
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import bindparam, exists, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 from app.db.models import User, Trip, UserPreference, TripVersion
 from app.schemas.user import UserCreate, UserUpdate
 from app.schemas.trip import (
@@ -14,45 +16,91 @@ from app.schemas.trip import (
 )
 from app.schemas.preference import PreferenceCreate, PreferenceUpdate
 
+# Single-row lookups are built once at import and executed with bound
+# parameters, so each call skips constructing and cache-keying a new select().
+_GET_USER_BY_ID = select(User).where(User.id == bindparam("id"))
+_GET_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_USER_EMAIL_EXISTS = select(exists().where(User.email == bindparam("email")))
+_GET_TRIP_BY_ID = select(Trip).where(Trip.id == bindparam("id"))
+_GET_TRIP_VERSION_BY_ID = select(TripVersion).where(TripVersion.id == bindparam("id"))
+_GET_LATEST_TRIP_VERSION = (
+    select(TripVersion)
+    .where(TripVersion.trip_id == bindparam("trip_id"))
+    .order_by(TripVersion.version_number.desc())
+    .limit(1)
+)
+_GET_PREFERENCE_BY_USER_ID = select(UserPreference).where(
+    UserPreference.user_id == bindparam("user_id")
+)
+
+_IMMUTABLE_FIELDS = frozenset({"id", "created_at"})
+
+
+def _mutable_columns(model: type) -> frozenset[str]:
+    """Column attributes an update may write, resolved once per model."""
+    columns = frozenset(attr.key for attr in inspect(model).column_attrs)
+    return columns - _IMMUTABLE_FIELDS
+
+
+_USER_MUTABLE_FIELDS = _mutable_columns(User)
+_TRIP_VERSION_MUTABLE_FIELDS = _mutable_columns(TripVersion)
+_PREFERENCE_MUTABLE_FIELDS = _mutable_columns(UserPreference)
+
+
+def _updated_values(
+    obj_in: BaseModel | dict[str, Any], allowed: frozenset[str]
+) -> Iterator[tuple[str, Any]]:
+    """Yield the explicitly set fields of ``obj_in`` that map to columns."""
+    if isinstance(obj_in, dict):
+        for field in obj_in.keys() & allowed:
+            yield field, obj_in[field]
+    else:
+        for field in obj_in.model_fields_set & allowed:
+            yield field, getattr(obj_in, field)
+
 
 class CRUDUser:
     """CRUD operations for User."""
 
     async def get_by_id(self, db: AsyncSession, id: UUID) -> User | None:
-        result = await db.execute(select(User).where(User.id == id))
+        result = await db.execute(_GET_USER_BY_ID, {"id": id})
         return result.scalar_one_or_none()
 
     async def get_by_email(self, db: AsyncSession, email: str) -> User | None:
-        result = await db.execute(select(User).where(User.email == email))
+        result = await db.execute(_GET_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
-    async def create(self, db: AsyncSession, obj_in: UserCreate) -> User:
-        hashed_password = get_password_hash(obj_in.password)
+    async def email_exists(self, db: AsyncSession, email: str) -> bool:
+        """Check for a registered email without loading the user row."""
+        return bool(await db.scalar(_USER_EMAIL_EXISTS, {"email": email}))
+
+    async def create(
+        self, db: AsyncSession, obj_in: UserCreate, commit: bool = True
+    ) -> User:
+        """Create a user; with ``commit=False`` the row is only flushed."""
+        hashed_password = await get_password_hash_async(obj_in.password)
         db_obj = User(
             email=obj_in.email.lower(),
             hashed_password=hashed_password,
             name=obj_in.name,
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        # Server-generated columns come back via RETURNING (eager_defaults)
+        # and the session keeps attributes after commit, so no refresh.
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
         return db_obj
 
     async def update(
         self, db: AsyncSession, db_obj: User, obj_in: UserUpdate | dict[str, Any]
     ) -> User:
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            if hasattr(db_obj, field):
-                setattr(db_obj, field, value)
+        for field, value in _updated_values(obj_in, _USER_MUTABLE_FIELDS):
+            setattr(db_obj, field, value)
 
         db.add(db_obj)
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
 
@@ -60,7 +108,7 @@ class CRUDTrip:
     """CRUD operations for Trip."""
 
     async def get(self, db: AsyncSession, id: UUID) -> Trip | None:
-        result = await db.execute(select(Trip).where(Trip.id == id))
+        result = await db.execute(_GET_TRIP_BY_ID, {"id": id})
         return result.scalar_one_or_none()
 
     async def get_multi_by_owner(
@@ -75,7 +123,6 @@ class CRUDTrip:
         db_obj = Trip(**obj_in.model_dump(), user_id=user_id)
         db.add(db_obj)
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
 
@@ -83,18 +130,13 @@ class CRUDTripVersion:
     """CRUD operations for TripVersion."""
 
     async def get(self, db: AsyncSession, id: UUID) -> TripVersion | None:
-        result = await db.execute(select(TripVersion).where(TripVersion.id == id))
+        result = await db.execute(_GET_TRIP_VERSION_BY_ID, {"id": id})
         return result.scalar_one_or_none()
 
     async def get_latest_for_trip(
         self, db: AsyncSession, trip_id: UUID
     ) -> TripVersion | None:
-        result = await db.execute(
-            select(TripVersion)
-            .where(TripVersion.trip_id == trip_id)
-            .order_by(TripVersion.version_number.desc())
-            .limit(1)
-        )
+        result = await db.execute(_GET_LATEST_TRIP_VERSION, {"trip_id": trip_id})
         return result.scalar_one_or_none()
 
     async def create(
@@ -111,7 +153,6 @@ class CRUDTripVersion:
         )
         db.add(db_obj)
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
     async def update(
@@ -120,22 +161,19 @@ class CRUDTripVersion:
         db_obj: TripVersion,
         obj_in: TripVersionUpdate | dict[str, Any],
     ) -> TripVersion:
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            if hasattr(db_obj, field):
-                # Handle nested dicts/lists for JSONB fields
-                if hasattr(value, "model_dump"):
-                    setattr(db_obj, field, value.model_dump())
-                else:
-                    setattr(db_obj, field, value)
+        for field, value in _updated_values(obj_in, _TRIP_VERSION_MUTABLE_FIELDS):
+            # Nested schemas are stored in JSONB columns as plain dicts
+            if isinstance(value, BaseModel):
+                value = value.model_dump()
+            elif isinstance(value, list):
+                value = [
+                    item.model_dump() if isinstance(item, BaseModel) else item
+                    for item in value
+                ]
+            setattr(db_obj, field, value)
 
         db.add(db_obj)
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
 
@@ -145,9 +183,7 @@ class CRUDUserPreference:
     async def get_by_user_id(
         self, db: AsyncSession, user_id: UUID
     ) -> UserPreference | None:
-        result = await db.execute(
-            select(UserPreference).where(UserPreference.user_id == user_id)
-        )
+        result = await db.execute(_GET_PREFERENCE_BY_USER_ID, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def create(
@@ -156,20 +192,16 @@ class CRUDUserPreference:
         db_obj = UserPreference(**obj_in.model_dump(), user_id=user_id)
         db.add(db_obj)
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
     async def update(
         self, db: AsyncSession, db_obj: UserPreference, obj_in: PreferenceUpdate
     ) -> UserPreference:
-        update_data = obj_in.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            if hasattr(db_obj, field):
-                setattr(db_obj, field, value)
+        for field, value in _updated_values(obj_in, _PREFERENCE_MUTABLE_FIELDS):
+            setattr(db_obj, field, value)
 
         db.add(db_obj)
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
 
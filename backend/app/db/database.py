@@ -1,3 +1,5 @@
+from typing import Any, ClassVar
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.engine.url import make_url
@@ -29,11 +31,25 @@ try:
                 connect_args["ssl"] = ssl.create_default_context()
         url_obj = url_obj.set(query=query)
         db_url = url_obj
+
+        # Keep every CRUD/auth statement prepared on the connection, and skip
+        # the PostgreSQL JIT, which only adds planning overhead for our short
+        # queries. Pin the session time zone so timezone('UTC', now())
+        # defaults store UTC. These are asyncpg-only connect() arguments.
+        connect_args["prepared_statement_cache_size"] = settings.db_statement_cache_size
+        connect_args["server_settings"] = {"jit": "off", "timezone": "UTC"}
 except Exception:
     # Fall back to raw URL if parsing fails.
     db_url = settings.database_url
 
-engine = create_async_engine(db_url, echo=settings.debug, connect_args=connect_args)
+engine = create_async_engine(
+    db_url,
+    echo=settings.debug,
+    connect_args=connect_args,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+)
 
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
@@ -41,4 +57,6 @@ AsyncSessionLocal = async_sessionmaker(
 
 
 class Base(DeclarativeBase):
-    pass
+    # Timestamps are generated by PostgreSQL (server defaults plus an
+    # updated_at trigger); fetch them with RETURNING in the same statement.
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
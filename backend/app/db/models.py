@@ -7,19 +7,24 @@ V1 Design Philosophy:
 """
 
 from __future__ import annotations
+import os
+import time
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
     String,
     Text,
     Integer,
+    LargeBinary,
     UniqueConstraint,
     Index,
     ForeignKey,
     func,
     DateTime,
+    FetchedValue,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -27,13 +32,25 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.database import Base
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land at the right edge of their B-tree instead of random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class User(Base):
     """User account table."""
 
     __tablename__ = "users"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -54,15 +71,13 @@ class User(Base):
     )  # "email" or "google"
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -77,11 +92,6 @@ class User(Base):
         back_populates="user", cascade="all, delete-orphan"
     )
 
-    __table_args__ = (
-        Index("idx_users_email", "email"),
-        Index("idx_users_google_id", "google_id"),
-    )
-
 
 class RefreshToken(Base):
     """Refresh token storage for multi-device session management.
@@ -93,7 +103,7 @@ class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -101,9 +111,9 @@ class RefreshToken(Base):
         nullable=False,
         index=True,
     )
-    token_hash: Mapped[str] = mapped_column(
-        String(255), nullable=False, unique=True
-    )  # SHA-256 hash of the token
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), nullable=False, unique=True
+    )  # Raw SHA-256 digest of the token (bytea)
     device_info: Mapped[Optional[str]] = mapped_column(
         String(255), nullable=True
     )  # User agent or device identifier
@@ -118,7 +128,6 @@ class RefreshToken(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
         nullable=False,
     )
@@ -130,9 +139,22 @@ class RefreshToken(Base):
     user: Mapped["User"] = relationship(back_populates="refresh_tokens")
 
     __table_args__ = (
-        Index("idx_refresh_tokens_user_id", "user_id"),
-        Index("idx_refresh_tokens_token_hash", "token_hash"),
+        # Partial covering index for the refresh lookup: revoked tokens are
+        # never queried, and the validity columns are served from the index.
+        Index(
+            "idx_refresh_tokens_hash_covering",
+            "token_hash",
+            postgresql_include=["revoked", "expires_at", "user_id"],
+            postgresql_where=text("revoked = false"),
+        ),
         Index("idx_refresh_tokens_expires_at", "expires_at"),
+        # Active sessions only; revoked rows never bloat per-user lookups.
+        Index(
+            "idx_refresh_tokens_active_user",
+            "user_id",
+            "expires_at",
+            postgresql_where=text("revoked = false"),
+        ),
     )
 
 
@@ -142,7 +164,7 @@ class UserPreference(Base):
     __tablename__ = "user_preferences"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -172,23 +194,19 @@ class UserPreference(Base):
     )  # e.g., "en", "fr", "es" - user's preferred language for responses
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
     # Relationships
     user: Mapped["User"] = relationship(back_populates="preferences")
 
-    __table_args__ = (Index("idx_user_preferences_user_id", "user_id"),)
-
 
 class Trip(Base):
     """Conceptual trip (origin → destination intent). Identity table, not versioned."""
@@ -196,7 +214,7 @@ class Trip(Base):
     __tablename__ = "trips"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -208,15 +226,13 @@ class Trip(Base):
     destination: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -235,7 +251,6 @@ class Trip(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "origin", "destination", name="unique_user_trip"),
-        Index("idx_trips_user_id", "user_id"),
         Index("idx_trips_origin_destination", "origin", "destination"),
     )
 
@@ -257,7 +272,7 @@ class TripVersion(Base):
     __tablename__ = "trip_versions"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     trip_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -373,15 +388,13 @@ class TripVersion(Base):
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -390,9 +403,7 @@ class TripVersion(Base):
 
     __table_args__ = (
         UniqueConstraint("trip_id", "version_number", name="unique_trip_version"),
-        Index("idx_trip_versions_trip_id", "trip_id"),
         Index("idx_trip_versions_status", "status"),
-        Index("idx_trip_versions_phase", "phase"),
         Index("idx_trip_versions_trip_status", "trip_id", "status"),
         # GIN indexes for JSONB querying
         Index(
@@ -414,7 +425,7 @@ class TripMessage(Base):
     __tablename__ = "trip_messages"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     trip_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -427,7 +438,6 @@ class TripMessage(Base):
     phase: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
         server_default=func.timezone("UTC", func.now()),
         nullable=False,
     )
@@ -435,6 +445,5 @@ class TripMessage(Base):
     trip: Mapped["Trip"] = relationship(back_populates="messages")
 
     __table_args__ = (
-        Index("idx_trip_messages_trip_id", "trip_id"),
         Index("idx_trip_messages_trip_id_created_at", "trip_id", "created_at"),
     )
@@ -1,15 +1,58 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.api.v1 import api_router
 from app.config import get_settings
+from app.db.database import AsyncSessionLocal
+from app.services import agent_store
+from app.services.auth import purge_stale_refresh_tokens
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+async def _purge_refresh_tokens_periodically(interval_seconds: int) -> None:
+    """Delete revoked and long-expired refresh tokens on a fixed interval."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                deleted = await purge_stale_refresh_tokens(db)
+            if deleted:
+                logger.info("Purged %d stale refresh tokens", deleted)
+        except Exception:
+            logger.exception("Refresh token purge failed")
+        await asyncio.sleep(interval_seconds)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await agent_store.connect()
+    purge_task = None
+    if settings.refresh_token_purge_interval_minutes > 0:
+        purge_task = asyncio.create_task(
+            _purge_refresh_tokens_periodically(
+                settings.refresh_token_purge_interval_minutes * 60
+            )
+        )
+    try:
+        yield
+    finally:
+        if purge_task is not None:
+            purge_task.cancel()
+        await agent_store.close()
+
 
 app = FastAPI(
-    title=settings.app_name, openapi_url=f"{settings.api_v1_str}/openapi.json"
+    title=settings.app_name,
+    openapi_url=f"{settings.api_v1_str}/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS Configuration
@@ -28,14 +71,7 @@ cors_origins: list[str] = []
 if settings.debug:
     cors_origins = ["*"]
 else:
-    if settings.frontend_urls:
-        cors_origins = [
-            origin.strip()
-            for origin in settings.frontend_urls.split(",")
-            if origin.strip()
-        ]
-    elif settings.frontend_url:
-        cors_origins = [settings.frontend_url]
+    cors_origins = list(settings.allowed_origins)
 
     # Always allow local development clients to hit production backend.
     for local_origin in ("http://localhost:3000", "http://127.0.0.1:3000"):
@@ -65,6 +101,13 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.api_v1_str)
 
 
-@app.get("/health")
+# Load balancers poll this constantly; the body never changes, so serve one
+# prebuilt response instead of encoding JSON on every probe.
+_HEALTH_OK = Response(
+    content=b'{"status":"ok"}', media_type="application/json", status_code=200
+)
+
+
+@app.get("/health", include_in_schema=False)
 async def health_check():
-    return JSONResponse(content={"status": "ok"}, status_code=200)
+    return _HEALTH_OK
@@ -10,17 +10,29 @@ from app.config import get_settings
 # Load settings
 settings = get_settings()
 
+# Static subset of https://accounts.google.com/.well-known/openid-configuration.
+# Supplying it up front means the first login does not block on a discovery
+# request. Signing keys rotate, so the JWKS is still fetched (and then cached
+# by Authlib) from jwks_uri.
+GOOGLE_OIDC_METADATA = {
+    "issuer": "https://accounts.google.com",
+    "authorize_url": "https://accounts.google.com/o/oauth2/v2/auth",
+    "access_token_url": "https://oauth2.googleapis.com/token",
+    "userinfo_endpoint": "https://openidconnect.googleapis.com/v1/userinfo",
+    "jwks_uri": "https://www.googleapis.com/oauth2/v3/certs",
+    "id_token_signing_alg_values_supported": ["RS256"],
+}
+
 # Create OAuth registry
 oauth = OAuth()
 
 # Register Google OAuth client
-# Uses OpenID Connect discovery URL for automatic configuration
 oauth.register(
     name="google",
     client_id=settings.GOOGLE_CLIENT_ID,
     client_secret=settings.GOOGLE_CLIENT_SECRET,
-    server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
     client_kwargs={
         "scope": "openid email profile",
     },
+    **GOOGLE_OIDC_METADATA,
 )
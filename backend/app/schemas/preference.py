@@ -24,6 +24,9 @@ class PreferenceCreate(BaseModel):
         default_factory=list
     )  # creates an empty list for every user
 
+    class Config:
+        defer_build = True
+
 
 class PreferenceUpdate(BaseModel):
     """Update user preferences (partial update)."""
@@ -35,6 +38,9 @@ class PreferenceUpdate(BaseModel):
     pace: Pace | None = None
     risk_tolerance: RiskTolerance | None = None
 
+    class Config:
+        defer_build = True
+
 
 # Response
 class PreferenceResponse(BaseModel):
@@ -51,3 +57,4 @@ class PreferenceResponse(BaseModel):
 
     class Config:
         from_attributes = True
+        defer_build = True
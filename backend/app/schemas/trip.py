@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 from typing import Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 
 
 # === Enums ===
@@ -26,6 +26,9 @@ class TravelConstraints(BaseModel):
     interests: list[str] = Field(default_factory=list)
     vibe: str | None = None
 
+    class Config:
+        defer_build = True
+
 
 class RiskAssessment(BaseModel):
     """Phase 2: Feasibility output."""
@@ -38,6 +41,9 @@ class RiskAssessment(BaseModel):
     warnings: list[str] = Field(default_factory=list)
     alternatives: list[str] = Field(default_factory=list)
 
+    class Config:
+        defer_build = True
+
 
 class Assumptions(BaseModel):
     """Phase 3: Assumptions output."""
@@ -45,6 +51,9 @@ class Assumptions(BaseModel):
     assumptions: list[str] = Field(default_factory=list)
     uncertain_assumptions: list[str] = Field(default_factory=list)
 
+    class Config:
+        defer_build = True
+
 
 class ActivityCost(BaseModel):
     """Individual activity within a day."""
@@ -53,6 +62,9 @@ class ActivityCost(BaseModel):
     cost_estimate: str | None = None
     cost_notes: str | None = None
 
+    class Config:
+        defer_build = True
+
 
 class DayPlan(BaseModel):
     """Single day itinerary."""
@@ -69,6 +81,9 @@ class DayPlan(BaseModel):
     day_total: str | None = None
     notes: str | None = None
 
+    class Config:
+        defer_build = True
+
 
 class BudgetBreakdown(BaseModel):
     """Phase 4: Budget output."""
@@ -83,6 +98,9 @@ class BudgetBreakdown(BaseModel):
     currency: str = "USD"
     notes: str | None = None
 
+    class Config:
+        defer_build = True
+
 
 class PlanSummary(BaseModel):
     """Phase 4: Plan summary (without days/budget)."""
@@ -92,6 +110,9 @@ class PlanSummary(BaseModel):
     buffer_days: int | None = None
     acclimatization_notes: str | None = None
 
+    class Config:
+        defer_build = True
+
 
 # === Request Schemas ===
 
@@ -103,6 +124,9 @@ class TripCreate(BaseModel):
     destination: str = Field(..., min_length=1, max_length=255)
     vibe: str | None = Field(None, max_length=100, description="Aesthetic/Vibe for the trip")
 
+    class Config:
+        defer_build = True
+
 
 class TripUpdate(BaseModel):
     """Update trip (only origin/destination can change)."""
@@ -110,6 +134,9 @@ class TripUpdate(BaseModel):
     origin: str | None = Field(None, min_length=1, max_length=255)
     destination: str | None = Field(None, min_length=1, max_length=255)
 
+    class Config:
+        defer_build = True
+
 
 class TripVersionCreate(BaseModel):
     """Create a new version (typically from refinement)."""
@@ -117,18 +144,31 @@ class TripVersionCreate(BaseModel):
     # Optionally copy from previous version
     copy_from_version: int | None = None
 
+    class Config:
+        defer_build = True
+
 
 class TripVersionUpdate(BaseModel):
-    """Update version data (used by agent during phases)."""
+    """Update version data (used by agent during phases).
+
+    The JSONB payloads come from agent output that is already validated
+    upstream, so they are stored as given instead of being re-validated
+    field by field; the types document the expected shapes.
+    """
 
     status: TripStatus | None = None
     phase: TripPhase | None = None
-    constraints_json: TravelConstraints | dict[str, Any] | None = None
-    risk_assessment_json: RiskAssessment | dict[str, Any] | None = None
-    assumptions_json: Assumptions | dict[str, Any] | None = None
-    plan_json: PlanSummary | dict[str, Any] | None = None
-    budget_breakdown_json: BudgetBreakdown | dict[str, Any] | None = None
-    days_json: list[DayPlan] | list[dict[str, Any]] | None = None
+    constraints_json: SkipValidation[TravelConstraints | dict[str, Any] | None] = None
+    risk_assessment_json: SkipValidation[RiskAssessment | dict[str, Any] | None] = None
+    assumptions_json: SkipValidation[Assumptions | dict[str, Any] | None] = None
+    plan_json: SkipValidation[PlanSummary | dict[str, Any] | None] = None
+    budget_breakdown_json: SkipValidation[
+        BudgetBreakdown | dict[str, Any] | None
+    ] = None
+    days_json: SkipValidation[list[DayPlan] | list[dict[str, Any]] | None] = None
+
+    class Config:
+        defer_build = True
 
 
 # === Response Schemas ===
@@ -168,6 +208,40 @@ class TripVersionSummary(BaseModel):
         from_attributes = True
 
 
+def version_to_response(version: Any) -> TripVersionResponse:
+    """Build a TripVersionResponse from a trusted ORM row without re-validation.
+
+    Skips the per-field ``from_attributes`` walk and the copy of every JSONB
+    blob that ``model_validate`` would make.
+    """
+    return TripVersionResponse.model_construct(
+        id=version.id,
+        trip_id=version.trip_id,
+        version_number=version.version_number,
+        status=version.status,
+        phase=version.phase,
+        constraints_json=version.constraints_json,
+        risk_assessment_json=version.risk_assessment_json,
+        assumptions_json=version.assumptions_json,
+        plan_json=version.plan_json,
+        budget_breakdown_json=version.budget_breakdown_json,
+        days_json=version.days_json,
+        created_at=version.created_at,
+        updated_at=version.updated_at,
+    )
+
+
+def version_to_summary(version: Any) -> TripVersionSummary:
+    """Build a TripVersionSummary from a trusted ORM row without re-validation."""
+    return TripVersionSummary.model_construct(
+        id=version.id,
+        version_number=version.version_number,
+        status=version.status,
+        phase=version.phase,
+        created_at=version.created_at,
+    )
+
+
 class TripResponse(BaseModel):
     """Full trip response with latest version."""
 
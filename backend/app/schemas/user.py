@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 from pydantic import BaseModel, EmailStr, Field
 from uuid import UUID
 
@@ -27,11 +28,27 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+def user_to_response(user: Any) -> UserResponse:
+    """Build a UserResponse from a trusted ORM ``User`` without re-validation."""
+    return UserResponse.model_construct(
+        id=user.id,
+        email=user.email,
+        name=user.name,
+        picture_url=user.picture_url,
+        user_type=user.user_type,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
 class Token(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
 
+    class Config:
+        defer_build = True
+
 
 class TokenResponse(BaseModel):
     access_token: str
@@ -56,8 +73,12 @@ class UserPublic(BaseModel):
 
     class Config:
         from_attributes = True
+        defer_build = True
 
 
 class UserUpdate(BaseModel):
     name: str | None
     # Note: email shouldn't be updatable via API
+
+    class Config:
+        defer_build = True
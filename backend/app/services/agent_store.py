@@ -0,0 +1,151 @@
+"""Agent session store.
+
+When ``REDIS_URL`` is configured, Redis is the source of truth: each save
+writes a snapshot of the agent's serialisable state to ``agent:{trip_id}``
+with a sliding TTL, tagged with a fresh revision id, so any worker can resume
+a planning conversation and restarts no longer drop it. Workers also keep the
+live ``TravelAgent`` they last loaded or saved, so background searches
+(futures) keep running between requests; that copy is only reused while its
+revision still matches the one in Redis, otherwise the snapshot is restored.
+
+Without Redis (or without the ``redis`` extra installed) the store falls back
+to the in-memory dict alone, matching the previous single-process behaviour.
+"""
+
+import logging
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+import orjson
+from fastapi import HTTPException, status
+
+from app.agent.agent import TravelAgent
+from app.agent.models import ConversationState, InitialExtraction
+from app.config import get_settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is optional; fall back to in-memory sessions
+    aioredis = None
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "agent:"
+
+# Per-process cache of live agents, keyed by trip_id, with the revision of the
+# snapshot they correspond to (None when Redis is not in use).
+_local: dict[UUID, tuple[Optional[str], TravelAgent]] = {}
+_redis: Optional[Any] = None
+
+
+def _key(trip_id: UUID) -> str:
+    return f"{_KEY_PREFIX}{trip_id}"
+
+
+async def connect() -> None:
+    """Open the Redis connection pool if ``redis_url`` is configured."""
+    global _redis
+    if not settings.redis_url or _redis is not None:
+        return
+    if aioredis is None:
+        logger.warning("REDIS_URL is set but redis is not installed; using memory")
+        return
+    _redis = aioredis.from_url(settings.redis_url)
+
+
+async def close() -> None:
+    """Close the Redis connection pool, if one was opened."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def _dump(agent: TravelAgent, revision: str) -> bytes:
+    """Serialise the parts of an agent needed to resume the conversation."""
+    extraction = agent._initial_extraction
+    return orjson.dumps(
+        {
+            "revision": revision,
+            "state": agent.state.model_dump(mode="json"),
+            "language_code": agent.language_code,
+            "search_results": agent.search_results,
+            "user_interests": agent.user_interests,
+            "initial_extraction": (
+                extraction.model_dump(mode="json") if extraction else None
+            ),
+            "destination_images": agent.destination_images,
+            "flight_costs": agent._flight_costs,
+            "hotel_costs": agent._hotel_costs,
+            "train_costs": agent._train_costs,
+        }
+    )
+
+
+def _restore(data: dict[str, Any]) -> TravelAgent:
+    """Rebuild a ``TravelAgent`` from a decoded ``_dump`` snapshot."""
+    agent = TravelAgent(
+        api_key=settings.openrouter_api_key,
+        language_code=data["language_code"],
+    )
+    agent.state = ConversationState.model_validate(data["state"])
+    agent.search_results = data["search_results"]
+    agent.user_interests = data["user_interests"]
+    if data["initial_extraction"] is not None:
+        agent._initial_extraction = InitialExtraction.model_validate(
+            data["initial_extraction"]
+        )
+    agent.destination_images = data["destination_images"]
+    agent._flight_costs = data["flight_costs"]
+    agent._hotel_costs = data["hotel_costs"]
+    agent._train_costs = data["train_costs"]
+    return agent
+
+
+async def load(trip_id: UUID) -> TravelAgent:
+    """Return the agent for a trip, or raise 409 if the session is gone.
+
+    With Redis, the snapshot is fetched (refreshing its TTL) and the local
+    agent is reused only if it holds the same revision; a newer save from
+    another worker is restored instead.
+    """
+    if _redis is None:
+        local = _local.get(trip_id)
+        if local is not None:
+            return local[1]
+    else:
+        blob = await _redis.getex(_key(trip_id), ex=settings.agent_session_ttl_seconds)
+        if blob is not None:
+            data = orjson.loads(blob)
+            local = _local.get(trip_id)
+            if local is not None and local[0] == data["revision"]:
+                return local[1]
+            agent = _restore(data)
+            _local[trip_id] = (data["revision"], agent)
+            return agent
+        _local.pop(trip_id, None)
+
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=("Planning session expired or not found. Please start a new trip."),
+    )
+
+
+async def save(trip_id: UUID, agent: TravelAgent) -> None:
+    """Store an agent locally and, when configured, snapshot it to Redis."""
+    if _redis is None:
+        _local[trip_id] = (None, agent)
+        return
+    revision = uuid4().hex
+    await _redis.set(
+        _key(trip_id), _dump(agent, revision), ex=settings.agent_session_ttl_seconds
+    )
+    _local[trip_id] = (revision, agent)
+
+
+async def delete(trip_id: UUID) -> None:
+    """Drop a trip's agent session everywhere."""
+    _local.pop(trip_id, None)
+    if _redis is not None:
+        await _redis.delete(_key(trip_id))
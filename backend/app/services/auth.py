@@ -5,13 +5,13 @@ from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, func, or_, select, update
 from fastapi import HTTPException, status
 import jwt
 from app.db.crud import user as crud_user
 from app.core.security import (
     create_access_token,
-    verify_password,
+    verify_password_async,
     create_refresh_token_jwt,
     verify_refresh_token_jwt,
     hash_refresh_token,
@@ -22,17 +22,24 @@ from app.schemas.user import (
     UserLogin,
     TokenResponse,
     UserResponse,
+    user_to_response,
 )
 from app.db.models import User, RefreshToken
 
 settings = get_settings()
 
+# Token lifetimes are fixed for the life of the process.
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=settings.access_token_expire_minutes)
+_REFRESH_TOKEN_LIFETIME = timedelta(minutes=settings.refresh_token_expire_minutes)
+
 
 async def create_refresh_token_for_user(
     db: AsyncSession,
     user_id: str,
     device_info: Optional[str] = None,
     ip_address: Optional[str] = None,
+    commit: bool = True,
+    issued_at: Optional[datetime] = None,
 ) -> str:
     """Create a refresh token for a user and store it in the database.
 
@@ -41,6 +48,8 @@ async def create_refresh_token_for_user(
         user_id: User ID (as string)
         device_info: Optional device/user agent info
         ip_address: Optional IP address
+        commit: If False, only stage the row so the caller's commit covers it
+        issued_at: Timestamp the caller already took for this request, if any
 
     Returns:
         str: The plain refresh token (not hashed)
@@ -52,9 +61,7 @@ async def create_refresh_token_for_user(
     token_hash = hash_refresh_token(refresh_token)
 
     # Calculate expiry
-    expires_at = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.refresh_token_expire_minutes
-    )
+    expires_at = (issued_at or datetime.now(timezone.utc)) + _REFRESH_TOKEN_LIFETIME
 
     # Store in database
     db_token = RefreshToken(
@@ -65,7 +72,8 @@ async def create_refresh_token_for_user(
         expires_at=expires_at,
     )
     db.add(db_token)
-    await db.commit()
+    if commit:
+        await db.commit()
 
     return refresh_token
 
@@ -92,20 +100,18 @@ async def register_user(
         HTTPException: If email is already registered
     """
     # Check if user already exists
-    existing_user = await crud_user.get_by_email(db, email=user_in.email)
-    if existing_user:
+    if await crud_user.email_exists(db, email=user_in.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email is already registered",
         )
 
-    # Create user
-    user = await crud_user.create(db, obj_in=user_in)
+    # Create user; committed together with the refresh token below
+    user = await crud_user.create(db, obj_in=user_in, commit=False)
 
     # Create access token
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        subject=str(user.id), expires_delta=access_token_expires
+        subject=str(user.id), expires_delta=ACCESS_TOKEN_LIFETIME
     )
 
     # Create refresh token
@@ -117,7 +123,7 @@ async def register_user(
     return TokenResponse(
         access_token=access_token,
         refresh_token=refresh_token,
-        user=UserResponse.model_validate(user),
+        user=user_to_response(user),
     )
 
 
@@ -157,17 +163,16 @@ async def authenticate_user(
             detail="This account uses Google OAuth. Please sign in with Google.",
         )
 
-    # Verify password
-    if not verify_password(user_in.password, user.hashed_password):
+    # Verify password off the event loop; Argon2 takes tens of milliseconds
+    if not await verify_password_async(user_in.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect email or password",
         )
 
     # Create access token
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        subject=str(user.id), expires_delta=access_token_expires
+        subject=str(user.id), expires_delta=ACCESS_TOKEN_LIFETIME
     )
 
     # Create refresh token
@@ -179,7 +184,7 @@ async def authenticate_user(
     return TokenResponse(
         access_token=access_token,
         refresh_token=refresh_token,
-        user=UserResponse.model_validate(user),
+        user=user_to_response(user),
     )
 
 
@@ -193,7 +198,7 @@ async def get_user_profile(current_user: User) -> UserResponse:
     Returns:
         UserResponse: User profile data
     """
-    return UserResponse.model_validate(current_user)
+    return user_to_response(current_user)
 
 
 async def refresh_access_token(
@@ -239,7 +244,8 @@ async def refresh_access_token(
         select(RefreshToken).where(
             RefreshToken.token_hash == token_hash,
             RefreshToken.revoked == False,
-            RefreshToken.expires_at > datetime.now(timezone.utc),
+            # Compare against the database clock; no timestamp is bound per call
+            RefreshToken.expires_at > func.now(),
         )
     )
     db_token = result.scalar_one_or_none()
@@ -252,26 +258,26 @@ async def refresh_access_token(
     if user is None:
         raise credentials_exception
 
-    # Revoke the old refresh token (token rotation for security)
+    # Revoke the old refresh token (token rotation for security); committed
+    # in the same transaction that stores its replacement below
+    now = datetime.now(timezone.utc)
     db_token.revoked = True
-    db_token.last_used_at = datetime.now(timezone.utc)
-    await db.commit()
+    db_token.last_used_at = now
 
     # Create new access token
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        subject=str(user.id), expires_delta=access_token_expires
+        subject=str(user.id), expires_delta=ACCESS_TOKEN_LIFETIME
     )
 
     # Create new refresh token
     new_refresh_token = await create_refresh_token_for_user(
-        db, str(user.id), device_info, ip_address
+        db, str(user.id), device_info, ip_address, issued_at=now
     )
 
     return TokenResponse(
         access_token=access_token,
         refresh_token=new_refresh_token,
-        user=UserResponse.model_validate(user),
+        user=user_to_response(user),
     )
 
 
@@ -293,29 +299,57 @@ async def logout_user(
         dict: Success message
     """
     if logout_all:
-        # Revoke all tokens for the user
-        result = await db.execute(
-            select(RefreshToken).where(
+        # Revoke all tokens for the user in one statement
+        await db.execute(
+            update(RefreshToken)
+            .where(
                 RefreshToken.user_id == user_id,
                 RefreshToken.revoked == False,
             )
+            .values(revoked=True)
+            .execution_options(synchronize_session=False)
         )
-        tokens = result.scalars().all()
-        for token in tokens:
-            token.revoked = True
     elif refresh_token:
         # Revoke specific token
         token_hash = hash_refresh_token(refresh_token)
-        result = await db.execute(
-            select(RefreshToken).where(
+        await db.execute(
+            update(RefreshToken)
+            .where(
                 RefreshToken.token_hash == token_hash,
                 RefreshToken.user_id == user_id,
                 RefreshToken.revoked == False,
             )
+            .values(revoked=True)
+            .execution_options(synchronize_session=False)
         )
-        db_token = result.scalar_one_or_none()
-        if db_token:
-            db_token.revoked = True
 
     await db.commit()
     return {"message": "Successfully logged out"}
+
+
+async def purge_stale_refresh_tokens(
+    db: AsyncSession, retention: timedelta = timedelta(days=7)
+) -> int:
+    """Physically delete refresh tokens that can never be used again.
+
+    Args:
+        db: Database session
+        retention: How long expired rows are kept after expiry; revoked
+            rows are removed immediately
+
+    Returns:
+        int: Number of rows deleted
+    """
+    cutoff = datetime.now(timezone.utc) - retention
+    result = await db.execute(
+        delete(RefreshToken)
+        .where(
+            or_(
+                RefreshToken.revoked == True,
+                RefreshToken.expires_at < cutoff,
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount
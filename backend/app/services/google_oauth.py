@@ -8,18 +8,14 @@ This service handles the Google OAuth flow, including:
 """
 
 from typing import Optional
-from datetime import timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import or_, select
 
-from app.config import get_settings
 from app.db.models import User
 from app.core.security import create_access_token
-from app.services.auth import create_refresh_token_for_user
-from app.schemas.user import TokenResponse, UserResponse
-
-settings = get_settings()
+from app.services.auth import ACCESS_TOKEN_LIFETIME, create_refresh_token_for_user
+from app.schemas.user import TokenResponse, user_to_response
 
 
 class GoogleOAuthService:
@@ -69,21 +65,24 @@ class GoogleOAuthService:
         if not email_verified:
             raise ValueError("Email address not verified by Google")
 
-        # Check if user exists by Google ID
-        result = await db.execute(select(User).where(User.google_id == google_id))
-        user = result.scalar_one_or_none()
+        # Look up both the Google ID and the email in one round trip; a
+        # Google ID match wins over an email match.
+        result = await db.execute(
+            select(User).where(or_(User.google_id == google_id, User.email == email))
+        )
+        candidates = result.scalars().all()
+        user = next((u for u in candidates if u.google_id == google_id), None)
 
+        # User changes below are left pending and committed together with the
+        # refresh token, so sign-in costs a single transaction.
         if user:
             # Update user info if changed
             if user.name != name or user.picture_url != picture_url:
                 user.name = name
                 user.picture_url = picture_url
-                await db.commit()
-                await db.refresh(user)
         else:
             # Check if user exists by email (might have signed up with password)
-            result = await db.execute(select(User).where(User.email == email))
-            user = result.scalar_one_or_none()
+            user = next((u for u in candidates if u.email == email), None)
 
             if user:
                 # Security: Don't auto-link if user has a password-based account
@@ -99,8 +98,6 @@ class GoogleOAuthService:
                 user.auth_provider = "google"
                 user.name = name
                 user.picture_url = picture_url
-                await db.commit()
-                await db.refresh(user)
             else:
                 # Create new user
                 user = User(
@@ -112,13 +109,11 @@ class GoogleOAuthService:
                     hashed_password=None,  # No password for OAuth users
                 )
                 db.add(user)
-                await db.commit()
-                await db.refresh(user)
+                await db.flush()
 
         # Create JWT tokens (reuse existing token logic)
-        access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
         access_token = create_access_token(
-            subject=str(user.id), expires_delta=access_token_expires
+            subject=str(user.id), expires_delta=ACCESS_TOKEN_LIFETIME
         )
 
         refresh_token = await create_refresh_token_for_user(
@@ -128,5 +123,5 @@ class GoogleOAuthService:
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
-            user=UserResponse.model_validate(user),
+            user=user_to_response(user),
         )
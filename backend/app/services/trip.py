@@ -14,9 +14,10 @@ from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, delete, func, select, true
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.agent.agent import TravelAgent
 from app.agent.language_utils import get_user_language, update_user_language
@@ -26,40 +27,20 @@ from app.schemas.trip import (
     AgentResponse,
     TripResponse,
     TripSummary,
-    TripVersionResponse,
-    TripVersionSummary,
+    version_to_response,
+    version_to_summary,
     TripWithVersions,
 )
+from app.services import agent_store
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# ---------------------------------------------------------------------------
-# In-memory agent session store
-# ---------------------------------------------------------------------------
-# Maps trip_id → TravelAgent.  Sessions live for the duration of the
-# planning conversation.  Lost on server restart — the DB retains all
-# phase data so the frontend can still display past results.
-# TODO: Replace with Redis-backed sessions for horizontal scaling.
-_agent_sessions: dict[UUID, TravelAgent] = {}
-
-
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _get_agent(trip_id: UUID) -> TravelAgent:
-    """Retrieve a live agent session or raise 409."""
-    agent = _agent_sessions.get(trip_id)
-    if agent is None:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=("Planning session expired or not found. Please start a new trip."),
-        )
-    return agent
-
-
 async def _get_user_trip(db: AsyncSession, trip_id: UUID, user_id: UUID) -> Trip:
     """Fetch a trip owned by the given user, or 404."""
     result = await db.execute(
@@ -93,7 +74,7 @@ async def _latest_version(db: AsyncSession, trip_id: UUID) -> TripVersion:
 async def _persist_state(
     db: AsyncSession, version: TripVersion, agent: TravelAgent
 ) -> None:
-    """Write the current agent state into the TripVersion row."""
+    """Write the agent state into the TripVersion row and the session store."""
     state = agent.state
     version.phase = state.phase.value
 
@@ -115,6 +96,7 @@ async def _persist_state(
 
     await db.commit()
     await db.refresh(version)
+    await agent_store.save(version.trip_id, agent)
 
 
 async def _store_message(
@@ -228,7 +210,7 @@ async def start_trip_conversation(
         await db.refresh(existing_trip)
         await db.refresh(version)
 
-        _agent_sessions[existing_trip.id] = agent
+        await agent_store.save(existing_trip.id, agent)
 
         await _store_message(
             db,
@@ -259,7 +241,7 @@ async def start_trip_conversation(
     await db.refresh(version)
 
     # Store live session
-    _agent_sessions[trip.id] = agent
+    await agent_store.save(trip.id, agent)
 
     await _store_message(
         db,
@@ -303,7 +285,7 @@ async def submit_clarification(
         AgentResponse with feasibility assessment and ``has_high_risk`` flag.
     """
     await _get_user_trip(db, trip_id, user_id)
-    agent = _get_agent(trip_id)
+    agent = await agent_store.load(trip_id)
     agent.on_status = on_status
     version = await _latest_version(db, trip_id)
 
@@ -359,7 +341,7 @@ async def proceed_after_feasibility(
         AgentResponse with planning assumptions (or rejection message).
     """
     await _get_user_trip(db, trip_id, user_id)
-    agent = _get_agent(trip_id)
+    agent = await agent_store.load(trip_id)
     agent.on_status = on_status
     version = await _latest_version(db, trip_id)
 
@@ -420,7 +402,7 @@ async def confirm_trip_assumptions(
         AgentResponse with the generated travel plan.
     """
     await _get_user_trip(db, trip_id, user_id)
-    agent = _get_agent(trip_id)
+    agent = await agent_store.load(trip_id)
     agent.on_status = on_status
     version = await _latest_version(db, trip_id)
 
@@ -485,7 +467,7 @@ async def refine_trip_plan(
         AgentResponse with the refined plan.
     """
     await _get_user_trip(db, trip_id, user_id)
-    agent = _get_agent(trip_id)
+    agent = await agent_store.load(trip_id)
     agent.on_status = on_status
     version = await _latest_version(db, trip_id)
 
@@ -556,13 +538,20 @@ async def list_user_trips(
         .subquery()
     )
 
+    # Select plain columns rather than the Trip entity: this is a read-only
+    # listing, so identity-map bookkeeping and attribute instrumentation for
+    # every row would be pure overhead.
     result = await db.execute(
         select(
-            Trip,
+            Trip.id,
+            Trip.origin,
+            Trip.destination,
+            Trip.created_at,
+            Trip.updated_at,
             TripVersion.status,
             TripVersion.phase,
-            TripMessage.content,
-            TripMessage.created_at,
+            TripMessage.content.label("last_message"),
+            TripMessage.created_at.label("last_message_at"),
         )
         .outerjoin(latest_vn, Trip.id == latest_vn.c.trip_id)
         .outerjoin(
@@ -587,20 +576,87 @@ async def list_user_trips(
 
     return [
         TripSummary(
-            id=trip.id,
-            origin=trip.origin,
-            destination=trip.destination,
-            status=ver_status,
-            phase=ver_phase,
-            last_message=last_message,
-            last_message_at=last_message_at,
-            created_at=trip.created_at,
-            updated_at=trip.updated_at,
+            id=row.id,
+            origin=row.origin,
+            destination=row.destination,
+            status=row.status,
+            phase=row.phase,
+            last_message=row.last_message,
+            last_message_at=row.last_message_at,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
         )
-        for trip, ver_status, ver_phase, last_message, last_message_at in rows
+        for row in rows
     ]
 
 
+async def get_trips_fingerprint(
+    db: AsyncSession,
+    user_id: UUID,
+) -> tuple[object, ...]:
+    """Return a cheap change marker for the user's trip list.
+
+    Covers everything ``list_user_trips`` renders: trip rows, their
+    versions, and the latest chat message.  Any insert, update or delete
+    that would change the list changes at least one of these values.
+
+    Args:
+        db: Database session.
+        user_id: User whose trips to fingerprint.
+
+    Returns:
+        Tuple of trip count and newest trip/version/message timestamps.
+    """
+    user_trip_ids = select(Trip.id).where(Trip.user_id == user_id)
+    result = await db.execute(
+        select(
+            select(func.count(Trip.id))
+            .where(Trip.user_id == user_id)
+            .scalar_subquery(),
+            select(func.max(Trip.updated_at))
+            .where(Trip.user_id == user_id)
+            .scalar_subquery(),
+            select(func.max(TripVersion.updated_at))
+            .where(TripVersion.trip_id.in_(user_trip_ids))
+            .scalar_subquery(),
+            select(func.max(TripMessage.created_at))
+            .where(TripMessage.trip_id.in_(user_trip_ids))
+            .scalar_subquery(),
+        )
+    )
+    return tuple(result.one())
+
+
+async def get_trip_versions_fingerprint(
+    db: AsyncSession,
+    trip_id: UUID,
+    user_id: UUID,
+) -> Optional[tuple[object, ...]]:
+    """Return a cheap change marker for a trip's version history.
+
+    Args:
+        db: Database session.
+        trip_id: Trip to fingerprint.
+        user_id: Authenticated user's ID (ownership check).
+
+    Returns:
+        Tuple of trip timestamp, version count and newest version
+        timestamp, or ``None`` if the trip doesn't exist for this user.
+    """
+    result = await db.execute(
+        select(
+            Trip.updated_at,
+            func.count(TripVersion.id),
+            func.max(TripVersion.updated_at),
+        )
+        .outerjoin(TripVersion, TripVersion.trip_id == Trip.id)
+        .where(Trip.id == trip_id, Trip.user_id == user_id)
+        .group_by(Trip.id)
+    )
+    row = result.one_or_none()
+    return tuple(row) if row is not None else None
+
+
 async def get_trip_detail(
     db: AsyncSession,
     trip_id: UUID,
@@ -616,19 +672,30 @@ async def get_trip_detail(
     Returns:
         TripResponse with latest version embedded.
     """
-    trip = await _get_user_trip(db, trip_id, user_id)
-
-    ver_result = await db.execute(
+    # Trip and its newest version in one round-trip via a LATERAL subquery.
+    latest_subq = (
         select(TripVersion)
-        .where(TripVersion.trip_id == trip.id)
+        .where(TripVersion.trip_id == Trip.id)
         .order_by(TripVersion.version_number.desc())
         .limit(1)
+        .lateral()
+    )
+    latest_version = aliased(TripVersion, latest_subq)
+    result = await db.execute(
+        select(Trip, latest_version)
+        .outerjoin(latest_version, true())
+        .where(Trip.id == trip_id, Trip.user_id == user_id)
     )
-    latest = ver_result.scalar_one_or_none()
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
+        )
+    trip, latest = row
 
     latest_resp = None
     if latest:
-        latest_resp = TripVersionResponse.model_validate(latest)
+        latest_resp = version_to_response(latest)
 
     return TripResponse(
         id=trip.id,
@@ -656,14 +723,21 @@ async def get_trip_version_history(
     Returns:
         TripWithVersions with ordered version list.
     """
-    trip = await _get_user_trip(db, trip_id, user_id)
-
-    ver_result = await db.execute(
-        select(TripVersion)
-        .where(TripVersion.trip_id == trip.id)
+    # One round-trip: each row is (trip, version), or (trip, None) when the
+    # trip has no versions yet.
+    result = await db.execute(
+        select(Trip, TripVersion)
+        .outerjoin(TripVersion, TripVersion.trip_id == Trip.id)
+        .where(Trip.id == trip_id, Trip.user_id == user_id)
         .order_by(TripVersion.version_number.asc())
     )
-    versions = ver_result.scalars().all()
+    rows = result.all()
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
+        )
+    trip = rows[0][0]
+    versions = [version for _, version in rows if version is not None]
 
     return TripWithVersions(
         id=trip.id,
@@ -672,7 +746,7 @@ async def get_trip_version_history(
         destination=trip.destination,
         created_at=trip.created_at,
         updated_at=trip.updated_at,
-        versions=[TripVersionSummary.model_validate(v) for v in versions],
+        versions=[version_to_summary(v) for v in versions],
     )
 
 
@@ -703,14 +777,24 @@ async def delete_user_trip(
         trip_id: Trip to delete.
         user_id: Authenticated user's ID (ownership check).
     """
-    trip = await _get_user_trip(db, trip_id, user_id)
-
-    # Clean up in-memory session
-    _agent_sessions.pop(trip_id, None)
-
-    await db.delete(trip)
+    # A single DELETE doubles as the ownership check.  Versions and messages
+    # go with it through the ON DELETE CASCADE foreign keys, so the ORM
+    # doesn't have to load and delete every child row one by one.
+    result = await db.execute(
+        delete(Trip)
+        .where(Trip.id == trip_id, Trip.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
+        )
     await db.commit()
 
+    # Clean up the agent session
+    await agent_store.delete(trip_id)
+
 
 async def _enforce_plan_limit(db: AsyncSession, user_id: UUID) -> None:
     user = await db.get(User, user_id)
@@ -0,0 +1,64 @@
+"""Tests for the authentication dependencies in app.api.deps."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api import deps
+from app.core.security import create_access_token
+from app.db.models import User
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    deps._user_cache.clear()
+    yield
+    deps._user_cache.clear()
+
+
+async def test_cached_user_survives_rollback_of_loading_session(engine):
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    user_id = uuid.uuid4()
+    now = datetime.now(UTC)
+    async with session_factory() as db:
+        db.add(
+            User(id=user_id, email="cache@example.com", created_at=now, updated_at=now)
+        )
+        await db.commit()
+    token = create_access_token(user_id, timedelta(minutes=5))
+
+    # First request loads and caches the user, then rolls back (as the
+    # IntegrityError path in start_trip_conversation does), which expires
+    # every instance in that session.
+    async with session_factory() as db:
+        user = await deps.get_current_user(token, db)
+        assert user.email == "cache@example.com"
+        await db.rollback()
+
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    # A later request is served from the cache with fully loaded columns.
+    async with session_factory() as db:
+        cached = await deps.get_current_user(token, db)
+        assert cached.id == user_id
+        assert cached.email == "cache@example.com"
+        assert cached.auth_provider == "email"
+        assert cached in db
+    assert statements == []
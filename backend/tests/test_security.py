@@ -0,0 +1,126 @@
+"""Tests for the token helpers in app.core.security."""
+
+import base64
+import hashlib
+import hmac
+import time
+
+import jwt
+import orjson
+import pytest
+
+from app.config import get_settings
+from app.core.security import _decode_hs256, verify_access_token
+
+SECRET = b"0123456789abcdef0123456789abcdef"
+HEADER = {"alg": "HS256", "typ": "JWT"}
+NOW = int(time.time())
+PAST = NOW - 3600
+FUTURE = NOW + 3600
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _sign(signing_input: str, secret: bytes = SECRET) -> str:
+    return _b64(hmac.new(secret, signing_input.encode(), hashlib.sha256).digest())
+
+
+def _token(payload, header=HEADER, secret: bytes = SECRET) -> str:
+    signing_input = f"{_b64(orjson.dumps(header))}.{_b64(orjson.dumps(payload))}"
+    return f"{signing_input}.{_sign(signing_input, secret)}"
+
+
+def _raw_token(header_segment: str, payload_segment: str) -> str:
+    signing_input = f"{header_segment}.{payload_segment}"
+    return f"{signing_input}.{_sign(signing_input)}"
+
+
+def _tampered_signature() -> str:
+    token = _token({"sub": "user", "exp": FUTURE})
+    return token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+
+def _tampered_payload() -> str:
+    header, _, signature = _token({"sub": "user", "exp": FUTURE}).split(".")
+    payload = _b64(orjson.dumps({"sub": "admin", "exp": FUTURE}))
+    return f"{header}.{payload}.{signature}"
+
+
+def _alg_none() -> str:
+    header = _b64(orjson.dumps({"alg": "none", "typ": "JWT"}))
+    payload = _b64(orjson.dumps({"sub": "user", "exp": FUTURE}))
+    return f"{header}.{payload}."
+
+
+CASES = {
+    "valid": _token({"sub": "user", "exp": FUTURE, "iat": PAST, "nbf": PAST}),
+    "valid_numeric_string_exp": _token({"sub": "user", "exp": str(FUTURE)}),
+    "tampered_signature": _tampered_signature(),
+    "tampered_payload": _tampered_payload(),
+    "wrong_secret": _token({"sub": "user", "exp": FUTURE}, secret=b"x" * 32),
+    "alg_none": _alg_none(),
+    "alg_missing": _token({"sub": "user", "exp": FUTURE}, header={"typ": "JWT"}),
+    "alg_hs512": _token({"sub": "user", "exp": FUTURE}, header={"alg": "HS512"}),
+    "expired": _token({"sub": "user", "exp": PAST}),
+    "exp_non_numeric": _token({"sub": "user", "exp": "soon"}),
+    "exp_float": _token({"sub": "user", "exp": FUTURE + 0.5}),
+    "nbf_future": _token({"sub": "user", "exp": FUTURE, "nbf": FUTURE}),
+    "nbf_non_numeric": _token({"sub": "user", "exp": FUTURE, "nbf": "later"}),
+    "iat_future": _token({"sub": "user", "exp": FUTURE, "iat": FUTURE}),
+    "iat_non_numeric": _token({"sub": "user", "exp": FUTURE, "iat": "then"}),
+    "sub_not_string": _token({"sub": 123, "exp": FUTURE}),
+    "sub_missing": _token({"exp": FUTURE}),
+    "exp_missing": _token({"sub": "user"}),
+    "jti_not_string": _token({"sub": "user", "exp": FUTURE, "jti": 7}),
+    "aud_present": _token({"sub": "user", "exp": FUTURE, "aud": "other"}),
+    "one_segment": "abc",
+    "two_segments": "abc.def",
+    "four_segments": _token({"sub": "user", "exp": FUTURE}) + ".extra",
+    "empty": "",
+    "bad_header_padding": _raw_token("a", _b64(b'{"sub":"user"}')),
+    "header_not_json": _raw_token(_b64(b"not json"), _b64(b'{"sub":"user"}')),
+    "header_not_object": _raw_token(_b64(b"[1]"), _b64(b'{"sub":"user"}')),
+    "payload_not_json": _raw_token(_b64(orjson.dumps(HEADER)), _b64(b"not json")),
+    "payload_not_object": _raw_token(_b64(orjson.dumps(HEADER)), _b64(b"[1]")),
+    "bad_signature_padding": _token({"sub": "user", "exp": FUTURE})[:-42] + "A",
+}
+
+
+def _outcome(decode, *args, **kwargs):
+    try:
+        return decode(*args, **kwargs)
+    except Exception as exc:
+        return type(exc)
+
+
+@pytest.mark.parametrize("required", [(), ("sub", "exp")])
+@pytest.mark.parametrize("token", CASES.values(), ids=CASES.keys())
+def test_decode_hs256_matches_pyjwt(token, required):
+    expected = _outcome(
+        jwt.decode,
+        token,
+        SECRET,
+        algorithms=["HS256"],
+        options={"require": list(required)},
+    )
+    assert _outcome(_decode_hs256, token, SECRET, required) == expected
+
+
+def test_access_token_with_non_string_subject_is_a_jwt_error():
+    token = _token({"sub": 123, "exp": FUTURE}, secret=get_settings().secret_key_bytes)
+    with pytest.raises(jwt.PyJWTError):
+        verify_access_token(token)
+
+
+def test_cached_access_token_payload_is_not_shared_between_callers():
+    token = _token(
+        {"sub": "user", "exp": FUTURE}, secret=get_settings().secret_key_bytes
+    )
+    first = verify_access_token(token)
+    first.pop("sub")
+    assert verify_access_token(token)["sub"] == "user"
+    second = verify_access_token(token)
+    second["sub"] = "admin"
+    assert verify_access_token(token)["sub"] == "user"